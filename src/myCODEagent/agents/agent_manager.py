@@ -9,6 +9,8 @@ from .base_agent import AgentConfig, BaseAgent
 from .conversation_agent import ConversationAgent, ConversationAgentConfig
 from .task_agent import TaskAgent, TaskAgentConfig
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class AgentManager:
     """Manages different agents and their configurations"""
@@ -36,7 +38,7 @@ class AgentManager:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
         with open(self.config_path, "r") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
 
         if (
             "assistants" not in config
@@ -4,6 +4,20 @@ import yaml
 import typer
 from dataclasses import dataclass
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_yaml_cache: Dict[Path, tuple] = {}
+
+
+def _load_yaml(path: Path):
+    """Parse a YAML file, reusing the previous result while its mtime is unchanged"""
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _yaml_cache.get(path)
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, yaml.load(path.read_bytes(), Loader=_YamlLoader))
+        _yaml_cache[path] = cached
+    return cached[1]
+
+
 @dataclass
 class TemplateField:
     name: str
@@ -30,22 +44,21 @@ class TemplateManager:
     def load_templates(self):
         """Load all templates from the templates directory"""
         for yaml_file in self.template_dir.glob("*.yml"):
-            with yaml_file.open() as f:
-                try:
-                    data = yaml.safe_load(f)
-                    if not data:
-                        continue
-                        
-                    # Handle different template types
-                    if "assistant_config" in data:
-                        self._process_assistant_template(yaml_file, data)
-                    elif "project" in data:
-                        self._process_project_template(yaml_file, data)
-                    elif "commands" in data:
-                        self._process_command_template(yaml_file, data)
-                except yaml.YAMLError:
+            try:
+                data = _load_yaml(yaml_file)
+                if not data:
                     continue
 
+                # Handle different template types
+                if "assistant_config" in data:
+                    self._process_assistant_template(yaml_file, data)
+                elif "project" in data:
+                    self._process_project_template(yaml_file, data)
+                elif "commands" in data:
+                    self._process_command_template(yaml_file, data)
+            except yaml.YAMLError:
+                continue
+
     def _process_template(self, file: Path, data: dict, type_key: str) -> Template:
         """Process a template file and extract fields"""
         fields = []
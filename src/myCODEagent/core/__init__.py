@@ -1,3 +1,3 @@
-from models.project import Project
+from models import Project
 
 __all__ = ["Project"]
@@ -1,34 +1,58 @@
+import functools
 import os
+from typing import Any, Optional
 
 import yaml
 from dpath import util as dpath_util
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 DEFAULT_CONFIG_PATH = "../assistant_config.yml"
 
 
-def get_config(dot_path_key: str, config_path: str = DEFAULT_CONFIG_PATH) -> str:
+@functools.lru_cache(maxsize=8)
+def _load_config(abs_config_path: str, mtime_ns: int) -> dict:
+    """Parse a YAML config file once per modification; see clear_config_cache()"""
+    with open(abs_config_path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def resolve_config_path(config_path: str = DEFAULT_CONFIG_PATH) -> str:
+    """Absolute path of a config file, relative paths taken from the working directory"""
+    return os.path.join(os.getcwd(), config_path)
+
+
+def clear_config_cache() -> None:
+    """Forget parsed config files so the next lookup rereads them"""
+    _load_config.cache_clear()
+
+
+def get_config(
+    dot_path_key: Optional[str] = None, config_path: str = DEFAULT_CONFIG_PATH
+) -> Any:
     """
     Load a field from the YAML config file using dot notation path.
 
     Args:
-        dot_path_key: The key path to look up in the config (e.g. 'parent.child.key')
+        dot_path_key: The key path to look up in the config (e.g. 'parent.child.key');
+            if omitted, the whole config is returned
         config_path: Path to the YAML config file, defaults to assistant_config.yml
 
     Returns:
-        str: The value for the requested key path
+        The value for the requested key path
 
     Raises:
         FileNotFoundError: If config file doesn't exist
-        KeyError: If ke{y path not found in config
+        KeyError: If key path not found in config
     """
-    # Get absolute path from current working directory
-    abs_config_path = os.path.join(os.getcwd(), config_path)
-
-    if not os.path.exists(abs_config_path):
+    abs_config_path = resolve_config_path(config_path)
+    try:
+        mtime_ns = os.stat(abs_config_path).st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"Config file not found at {abs_config_path}")
-
-    with open(abs_config_path) as f:
-        config = yaml.safe_load(f)
+    config = _load_config(abs_config_path, mtime_ns)
+    if dot_path_key is None:
+        return config
 
     try:
         return dpath_util.get(config, dot_path_key, separator=".")
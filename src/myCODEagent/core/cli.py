@@ -1,85 +1,174 @@
 import asyncio
-import difflib
+import atexit
+import contextlib
+import contextvars
+import functools
+import heapq
+import io
+import itertools
 import json
 import logging
+import logging.handlers
+import mmap
 import os
+import queue
 import random
-import shutil
-import signal
-import sqlite3
+import re
 import subprocess
-import sys
+import threading
 import time
-from datetime import datetime
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional
-import psycopg2
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Optional
+import orjson
 import typer
 import yaml
-from RealtimeSTT_server.stt_server import recorder
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from agents.conversation_agent import (
-    ConversationAgent,
-    ConversationAgentConfig,
-)
-from core.project_generator import SpecPromptGenerator
+from sqlalchemy import create_engine, event, func, insert, lambda_stmt, select
+from sqlalchemy.orm import selectinload, sessionmaker
 from commands.create_directory import setup_project_dir
 from models import (
     Base,
 )
-from elevenlabs import ElevenLabs
-from core.assistant_config import get_config
-from core.base_assistant import PlainAssistant
-from core.r1 import prefix_prompt
-from agents.template_manager import TemplateManager
-from core.voice import VoiceCommandSystem
-from main import PID_FILE, Daemonize
+from core.assistant_config import clear_config_cache, get_config, resolve_config_path
 from models import (
     Project,
     Task,
 )
 from utils.utils import (
+    TTLCache,
+    parse_voice_command,
+    FallbackResponder,
     create_session_logger_id,
     setup_github_repo,
     setup_logging,
     build_file_name_session,
-    run_mode,
-    write_pid,
-    play,
     seed_database,
     caesar_cipher_encrypt,
     caesar_cipher_decrypt,
+    tail_lines,
 )
 
+try:
+    import pygit2
+except ImportError:  # optional: libgit2 bindings for in-process git
+    pygit2 = None
+
+# The voice, agent and generator stacks, psycopg2 and rapidfuzz are imported
+# inside the commands that use them, so unrelated commands (and --help) don't
+# pay for loading them
+if TYPE_CHECKING:
+    from elevenlabs import ElevenLabs
+    from psycopg2 import pool
+
 
 # Create the Typer app
 app = typer.Typer()
+logger = logging.getLogger(__name__)
+
+# libyaml's C loader/dumper when PyYAML was built against it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+@functools.lru_cache(maxsize=1)
+def get_elevenlabs_client() -> "ElevenLabs":
+    """Get the shared ElevenLabs client"""
+    from elevenlabs import ElevenLabs
+
+    return ElevenLabs(api_key=os.getenv("ELEVEN_API_KEY"))
+
+
+@functools.lru_cache(maxsize=1)
+def get_recorder():
+    """Import the speech recorder on first use; loading the STT model is slow"""
+    from RealtimeSTT_server.stt_server import recorder
+
+    return recorder
+
 
 def get_voice_system(logger=None):
     """Get or create VoiceCommandSystem instance"""
     if not hasattr(get_voice_system, '_instance'):
+        from core.voice import VoiceCommandSystem
+
         if logger is None:
             logger = setup_logging(create_session_logger_id())
         get_voice_system._instance = VoiceCommandSystem(logger)
     return get_voice_system._instance
 
-# Initialize template manager
-template_manager = TemplateManager(...)
+@functools.lru_cache(maxsize=1)
+def get_template_manager():
+    """Get the shared TemplateManager"""
+    from agents.template_manager import TemplateManager
+
+    return TemplateManager(...)
+
+
+# Config values read on every voice turn. Entries expire, so an edited config
+# is picked up within CONFIG_CACHE_TTL seconds; reload-config applies it at once
+CONFIG_CACHE_TTL = 30.0
+_config_values = TTLCache(CONFIG_CACHE_TTL, maxsize=128)
+_MISSING = object()
+
+
+def _cached_config(dot_path_key: str) -> str:
+    """get_config for values read on every voice turn"""
+    value = _config_values.get(dot_path_key, _MISSING)
+    if value is _MISSING:
+        value = get_config(dot_path_key)
+        _config_values.set(dot_path_key, value)
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _load_template(path: str) -> str:
+    """Read a static prompt template once and reuse it for later calls"""
+    return Path(path).read_text()
 
 
 # List of commands that require additional authorization
 RESTRICTED_COMMANDS = ["delete-user", "migrate-database", "restore-data"]
 
+class _HistoryQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue history records untouched; formatting runs on the listener."""
+
+    def prepare(self, record):
+        return record
+
+
+class _HistoryFormatter(logging.Formatter):
+    """Serialize a history record's dict payload as one JSON line."""
+
+    def format(self, record):
+        return orjson.dumps(record.msg).decode()
+
+
+# Command history is written by a background listener thread so callers only
+# pay for an enqueue, never for serialization or file I/O.
+_history_queue = queue.SimpleQueue()
+_history_handler = logging.FileHandler("command_history.log", delay=True)
+_history_handler.setFormatter(_HistoryFormatter())
+_history_listener = logging.handlers.QueueListener(_history_queue, _history_handler)
+_history_listener.start()
+atexit.register(_history_listener.stop)
+
+_history_logger = logging.getLogger("aiden.command_history")
+_history_logger.setLevel(logging.INFO)
+_history_logger.propagate = False
+_history_logger.addHandler(_HistoryQueueHandler(_history_queue))
+
+
 def log_command_history(command: str, result: dict, user_input: str) -> None:
     """Log command execution history for auditing.
     :param command: The executed command.
     :param result: The  output of the command
     :param user_input: exec_command
     """
-    with open("command_history.log", "a") as f:
-        timestamp = datetime.now().isoformat()
-        f.write(f"{timestamp}: {command} - Success: {result['success']}\n")
+    _history_logger.info(
+        {"ts": time.time_ns(), "cmd": command, "ok": result["success"]}
+    )
 
 
 def check_voice_authorization(command_name: str) -> str:
@@ -113,77 +202,40 @@ def exec_command(command_name: str, *args, **kwargs) -> dict:
         return {"success": False, "error": str(e)}
 
 
-def parse_voice_command(text: str) -> tuple:
-    """
-    Parse voice command into command name and arguments.
-    Returns tuple of (command_name, args, kwargs)
-    """
-    # Remove filler words
-    text = text.lower().replace("please", "").replace("could you", "").strip()
-
-    # Basic command mappings
-    command_mappings = {
-        "show all tasks": ("list-tasks", ["--all"]),
-        "list my tasks": ("list-tasks", []),
-        "show config": ("show-config", []),
-        "show full config": ("show-config", ["--verbose"]),
-        "backup everything": ("backup-data", ["./backups", "--full"]),
-        "create backup": ("backup-data", ["./backups"]),
-        "list users": ("list-users", []),
-        "show admins": ("list-users", ["--role", "admin"]),
-        "ping server": ("ping-server", []),
-    }
-
-    # Check for exact matches first
-    if text in command_mappings:
-        return command_mappings[text][0], command_mappings[text][1], {}
-
-    # Handle dynamic commands
-    if "create user" in text:
-        parts = text.split("with role")
-        username = parts[0].replace("create user", "").strip()
-        role = parts[1].strip() if len(parts) > 1 else "guest"
-        return "create-user", [username], {"role": role}
-
-    if "create task" in text:
-        parts = text.split("with priority")
-        task_name = parts[0].replace("create task", "").strip()
-        priority = int(parts[1].strip()) if len(parts) > 1 else 1
-        return "queue-task", [task_name], {"priority": priority}
-
-    if "remove task" in text:
-        task_id = text.split("remove task")[-1].strip()
-        return "remove-task", [task_id], {"force": True}
-
-    return None, [], {}
+@functools.lru_cache(maxsize=1)
+def get_available_commands() -> tuple:
+    """Get all available commands for voice control.
 
-
-def get_available_commands() -> list:
-    """Get list of all available commands for voice control."""
-    commands = []
-    for command in app.commands:
-        commands.append(
+    The command table is static once the module is imported, so the result is
+    cached as a tuple of read-only mappings. Call
+    ``get_available_commands.cache_clear()`` after registering new commands.
+    """
+    return tuple(
+        MappingProxyType(
             {
                 "name": command.name,
                 "help": command.help,
-                "args": [param.name for param in command.params],
+                "args": tuple(param.name for param in command.params),
             }
         )
-    return commands
+        for command in app.commands
+    )
 
 
 def suggest_similar_command(text: str) -> str:
     """Suggest similar commands when voice command isn't recognized."""
+    from rapidfuzz import fuzz, process
+
     available_commands = get_available_commands()
     command_names = [cmd["name"] for cmd in available_commands]
 
-    # Use difflib to find close matches
-    from difflib import get_close_matches
-
-    matches = get_close_matches(text.lower(), command_names, n=1)
+    # Use RapidFuzz to find the closest match
+    match = process.extractOne(
+        text.lower(), command_names, scorer=fuzz.WRatio, score_cutoff=60
+    )
 
-    if matches:
-        return f"Did you mean '{matches[0]}'? You can say 'yes' to execute that command."
+    if match:
+        return f"Did you mean '{match[0]}'? You can say 'yes' to execute that command."
     return "Command not recognized. Say 'help' to see available commands."
 
 
@@ -192,30 +244,46 @@ class TyperAgent:
         self,
         logger: logging.Logger,
         session_id: str,
-        recorder: ElevenLabs,
+        recorder: "ElevenLabs",
         user_role: str = "user",
     ):
         # Define valid roles as a class constant
-        self.template_manager = template_manager.load_templates()
-        self.command_patterns = []
+        self.template_manager = get_template_manager().load_templates()
+        # Learned patterns as a min-heap of (-score, command)
+        self._patterns_heap: list[tuple[float, str]] = []
         self.voice_shortcuts = None
         self.recorder = recorder
         self.logger = logger
         self.session_id = session_id
         self.log_file = build_file_name_session("session.log", session_id)
-        self.elevenlabs_client = ElevenLabs(api_key=os.getenv("ELEVEN_API_KEY"))
+        self.elevenlabs_client = get_elevenlabs_client()
         self.previous_successful_requests = []
         self.previous_responses = []
         self.pending_command = None
         self.command_history = []
+        # Transcriptions from the recorder thread, started on first voice input
+        self._input_queue: queue.Queue[str] = queue.Queue()
+        self._recorder_thread: Optional[threading.Thread] = None
         self.user_role = user_role
         self.logger.info(f"👤 User role: {self.user_role}")
         log_command_history("init", {"success": True})
 
     def learn_user_patterns(self, item: str, matched_command: str) -> None:
         """Learn and adapt to user's voice command patterns."""
-        self.command_patterns[difflib.SequenceMatcher(None, item,
-        matched_command).ratio()] = matched_command
+        from rapidfuzz import fuzz
+
+        score = fuzz.ratio(item, matched_command) / 100
+        heapq.heappush(self._patterns_heap, (-score, matched_command))
+
+    def top_learned_commands(self, k: int = 3) -> list[str]:
+        """Return up to k learned commands, highest similarity score first."""
+        return [cmd for _, cmd in heapq.nsmallest(k, self._patterns_heap)]
+
+    def best_learned_command(self) -> Optional[str]:
+        """Return the learned command with the highest similarity score."""
+        if not self._patterns_heap:
+            return None
+        return self._patterns_heap[0][1]
 
     def register_voice_shortcut(self, phrase: str, command: str) -> None:
         """Register custom voice shortcuts for frequently used commands."""
@@ -297,35 +365,37 @@ class TyperAgent:
         """Build and format the prompt template with current state"""
         try:
             # Load typer file
-            self.logger.info("📂 Loading typer file...")
-            with open(typer_file, "r") as f:
-                typer_content = f.read()
+            self.logger.debug("📂 Loading typer file...")
+            typer_content = Path(typer_file).read_text()
 
             # Load scratchpad file
-            self.logger.info("📝 Loading scratchpad file...")
+            self.logger.debug("📝 Loading scratchpad file...")
             if not os.path.exists(scratchpad):
                 self.logger.error(f"📄 Scratchpad file {scratchpad} does not exist")
                 raise FileNotFoundError(f"Scratchpad file {scratchpad} does not exist")
 
-            with open(scratchpad, "r") as f:
-                scratchpad_content = f.read()
+            scratchpad_content = Path(scratchpad).read_text()
 
-            # Load context files
-            context_content = ""
+            # Load context files, overlapping the reads across a thread pool
             for file_path in context_files:
                 if not os.path.exists(file_path):
                     self.logger.error(f"📄 Context file {file_path} does not exist")
                     raise FileNotFoundError(f"Context file {file_path} does not exist")
 
-                with open(file_path, "r") as f:
-                    file_content = f.read()
-                    file_name = os.path.basename(file_path)
-                    context_content += f'\t<context name="{file_name}">\n{file_content}\n</context>\n\n'
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                file_contents = list(
+                    executor.map(lambda path: Path(path).read_text(), context_files)
+                )
+
+            parts = []
+            for file_path, file_content in zip(context_files, file_contents):
+                file_name = os.path.basename(file_path)
+                parts.append(f'\t<context name="{file_name}">\n{file_content}\n</context>\n\n')
+            context_content = "".join(parts)
 
             # Load and format prompt template
-            self.logger.info("📝 Loading prompt template...")
-            with open("prompts/typer-commands.xml", "r") as f:
-                prompt_template = f.read()
+            self.logger.debug("📝 Loading prompt template...")
+            prompt_template = _load_template("prompts/typer-commands.xml")
 
             # Replace template placeholders
             formatted_prompt = (
@@ -353,7 +423,7 @@ class TyperAgent:
         Process user speech input and map it to command functions with enhanced voice interaction.
         """
         try:
-            assistant_name = get_config("typer_assistant.assistant_name")
+            assistant_name = _cached_config("typer_assistant.assistant_name")
             if assistant_name.lower() not in text.lower():
                 self.speak(f"I'm {assistant_name}, but you weren't talking to me.")
                 return True
@@ -420,7 +490,8 @@ class TyperAgent:
                 else:
                     # Try to parse and execute as a natural language command
                     result = self.handle_voice_command(text)
-                    self.logger.info(f"Command result: {result}")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Command result: %r", result)
                     if not result:
                         self.speak(
                             "I didn't recognize that command. Try asking for help to see what I can do."
@@ -447,26 +518,42 @@ class TyperAgent:
             word in response for word in ["yes", "yeah", "sure", "okay", "confirm"]
         )
 
-    def get_voice_input(self) -> str:
+    def _record_loop(self) -> None:
+        """Recorder thread: queue every transcription for get_voice_input."""
+        while True:
+            try:
+                self.recorder.text(self._input_queue.put)
+            except Exception as e:
+                self.logger.error(f"Error in voice recorder: {str(e)}")
+                time.sleep(1)
+
+    def get_voice_input(self, timeout: float = 5.0) -> str:
         """Get voice input from user with timeout."""
-        self.recorder.start()
-        response = None
+        if self._recorder_thread is None:
+            self._recorder_thread = threading.Thread(target=self._record_loop, daemon=True)
+            self._recorder_thread.start()
 
-        # Wait for up to 5 seconds for response
-        for _ in range(50):  # 5 seconds with 0.1s sleep
-            if response:
+        # Anything already queued arrived after an earlier call timed out
+        while True:
+            try:
+                self._input_queue.get_nowait()
+            except queue.Empty:
                 break
-            time.sleep(0.1)
 
-        self.recorder.stop()
-        return response if response else ""
+        self.recorder.start()
+        try:
+            return self._input_queue.get(timeout=timeout) or ""
+        except queue.Empty:
+            return ""
+        finally:
+            self.recorder.stop()
 
-    def command_exists(command_name: str, COMMANDS_FILE=None) -> bool:
-        """Check if a command exists in the commands file."""
+    def command_exists(self, command_name: str, commands_file: Optional[str] = None) -> bool:
+        """Check if a command exists in the commands file (this module by default)."""
         try:
-            with open(COMMANDS_FILE, "r") as f:
-                content = f.read()
-                return f"def {command_name}(" in content
+            with open(commands_file or __file__, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm.find(f"def {command_name}(".encode()) != -1
         except Exception:
             return False
 
@@ -474,51 +561,6 @@ class TyperAgent:
         pass
 
 
-@app.command()
-def initialize():
-    """Initialize the application"""
-    # Create the configuration directory if it doesn't exist
-    config_dir = Path.home() / ".aiden"
-    config_dir.mkdir(parents=True, exist_ok=True)
-
-    # Create the configuration file if it doesn't exist
-    config_file = config_dir / "config.yml"
-    if not config_file.exists():
-        with open(config_file, "w") as f:
-            # Write default configuration to the file
-            yaml.dump({"project_name": "My Project", "project_description": "My project description"}, f)
-
-    # Create the project directory if it doesn't exist
-    project_dir = Path.cwd() / "project"
-    project_dir.mkdir(parents=True, exist_ok=True)
-
-    # Create the project files if they don't exist
-    project_files = ["main.py", "requirements.txt", "README.md"]
-    for file in project_files:
-        file_path = project_dir / file
-        if not file_path.exists():
-            with open(file_path, "w") as f:
-                # Write default content to the file
-                if file == "main.py":
-                    f.write("# Your Python code here")
-                elif file == "requirements.txt":
-                    f.write("# Your dependencies here")
-                elif file == "README.md":
-                    f.write("# Your project description here")
-
-    # Initialize the project with Git
-    try:
-        import git
-        repo = git.Repo.init(project_dir)
-        repo.index.add(["*"])
-        repo.index.commit("Initial commit")
-    except ImportError:
-        typer.echo("Git is not installed. Skipping Git initialization.")
-
-    typer.echo("Application initialized successfully!")
-
-
-
 # Define your Typer commands
 @app.command("project")
 def project(action: str):
@@ -534,12 +576,10 @@ def handle_create_project():
 
 @app.command()
 def think_speak(self, text: str):
-    response_prompt_base = ""
-    with open("prompts/concise-assistant-response.xml", "r") as f:
-        response_prompt_base = f.read()
+    response_prompt_base = _load_template("prompts/concise-assistant-response.xml")
 
-    assistant_name = get_config("typer_assistant.assistant_name")
-    human_companion_name = get_config("typer_assistant.human_companion_name")
+    assistant_name = _cached_config("typer_assistant.assistant_name")
+    human_companion_name = _cached_config("typer_assistant.human_companion_name")
 
     response_prompt = response_prompt_base.replace("{{latest_action}}", text)
     response_prompt = response_prompt.replace(
@@ -548,6 +588,8 @@ def think_speak(self, text: str):
     response_prompt = response_prompt.replace(
         "{{personal_ai_assistant_name}}", assistant_name
     )
+    from core.r1 import prefix_prompt
+
     prompt_prefix = f"Your Conversational Response: "
     response = prefix_prompt(
         prompt=response_prompt, prefix=prompt_prefix, no_prefix=True
@@ -558,6 +600,7 @@ def think_speak(self, text: str):
 
 @app.command()
 def tts(self, text: str):
+    from elevenlabs import stream
 
     start_time = time.time()
     model = "eleven_flash_v2_5"
@@ -565,92 +608,44 @@ def tts(self, text: str):
     # model = "eleven_turbo_v2"
     # model = "eleven_turbo_v2_5"
     # model="eleven_multilingual_v2"
-    voice = get_config("typer_assistant.elevenlabs_voice")
+    voice = _cached_config("typer_assistant.elevenlabs_voice")
 
-    audio_generator = self.elevenlabs_client.generate(
+    # Play chunks as they arrive instead of buffering the whole clip first
+    audio_stream = get_elevenlabs_client().generate(
         text=text,
         voice=voice,
         model=model,
-        stream=False,
+        stream=True,
     )
-    audio_bytes: bytes = b"".join(list(audio_generator))
+    stream(audio_stream)
     duration = time.time() - start_time
     self.logger.info(f"Model {model} completed tts in {duration:.2f} seconds")
-    start(audio_bytes)
 
 
 @app.command()
-def status():
+def status(
+    counts: bool = typer.Option(
+        False, "--counts", help="Also show project, task, dependency and user counts"
+    ),
+):
+    from main import PID_FILE
+
     if PID_FILE.exists():
         pid = PID_FILE.read_text().strip()
         typer.echo(f"✅ aiden running (PID: {pid})")
     else:
         typer.echo("❌ aiden not running")
 
+    if counts:
+        from db.models.schema import gather_dashboard
 
-@app.command()
-def start(
-    mode: str = typer.Option("cli", "--mode", "-m"),
-    daemon: bool = typer.Option(False, "--daemon", "-d"),
-):
-    if PID_FILE.exists():
-        typer.echo("🚫 aiden is already running")
-        raise typer.Exit(code=1)
-
-    if daemon:
-        daemon = Daemonize(
-            app="aiden",
-            pid=PID_FILE,
-            action=lambda: run_mode(mode),
-            chdir=str(Path.cwd()),
-        )
         try:
-            # First fork (detaches from parent)
-            try:
-                pid = os.fork()
-                if pid > 0:
-                    sys.exit(0)  # Parent exits
-            except OSError as err:
-                daemon.logger.error(f'First fork failed: {err}')
-                sys.exit(1)
-
-            # Decouple from parent environment
-            os.chdir(daemon.chdir)
-            os.umask(0)
-            os.setsid()
-
-            # Second fork (relinquish session leadership)
-            try:
-                pid = os.fork()
-                if pid > 0:
-                    sys.exit(0)  # Parent exits
-            except OSError as err:
-                daemon.logger.error(f'Second fork failed: {err}')
-                sys.exit(1)
-
-            # Flush I/O buffers and write PID file
-            sys.stdout.flush()
-            sys.stderr.flush()
-
-            # Write PID file
-            with open(daemon.pid_file, 'w') as f:
-                f.write(str(os.getpid()))
-
-            # Signal handlers
-            signal.signal(signal.SIGTERM, daemon._cleanup)
-            signal.signal(signal.SIGHUP, daemon._cleanup)
-
-            # Execute the daemon action
-            daemon.action()
-
+            # The four tables are read concurrently over the async pool
+            dashboard = asyncio.run(gather_dashboard())
         except Exception as e:
-            daemon.logger.error(f'Error starting daemon: {e}')
-            if daemon.pid_file.exists():
-                os.unlink(daemon.pid_file)
-            sys.exit(1)
-    else:
-        run_mode(mode)
-        write_pid()
+            typer.echo(f"❌ Failed to load counts: {str(e)}")
+            return
+        typer.echo("  ".join(f"{name}: {len(rows)}" for name, rows in dashboard.items()))
 
 
 @app.command()
@@ -658,6 +653,14 @@ def ping():
     print("pong")
 
 
+@app.command()
+def reload_config():
+    """Drop cached assistant config so the next lookup rereads the file"""
+    _config_values.clear()
+    clear_config_cache()
+    typer.echo("✅ Configuration cache cleared")
+
+
 @app.command(help="Start a chat session with the plain assistant using speech input")
 def process_text(text: str):
     """Process user speech input using ElevenLabs"""
@@ -667,22 +670,23 @@ def process_text(text: str):
     if text.lower() in ["quit", "exit", "stop"]:
         return
 
-    try:
-        # Initialize ElevenLabs client
-        elevenlabs_client = ElevenLabs(api_key=os.getenv("ELEVEN_API_KEY"))
+    from elevenlabs import stream
 
+    from core.base_assistant import PlainAssistant
+
+    try:
         # Process the text with the assistant
         assistant = PlainAssistant()
         response = assistant.process_input(text)
 
         # Convert response to speech using ElevenLabs
-        voice = get_config("typer_assistant.elevenlabs_voice")
-        audio = elevenlabs_client.generate(
-            text=response, voice=voice, model="eleven_turbo_v2"
+        voice = _cached_config("typer_assistant.elevenlabs_voice")
+        audio_stream = get_elevenlabs_client().generate(
+            text=response, voice=voice, model="eleven_turbo_v2", stream=True
         )
 
-        # Play the response
-        play(audio)
+        # Play the response as it streams in
+        stream(audio_stream)
 
     except Exception as e:
         typer.echo(f"❌ Error processing text: {str(e)}", err=True)
@@ -691,18 +695,40 @@ def process_text(text: str):
 
 @app.command()
 def get_connection():
-    """Connect to PostgreSQL (Supabase/Neon)"""
+    """Check that a pooled PostgreSQL (Supabase/Neon) connection can be made"""
     try:
-        conn = psycopg2.connect(os.getenv("SUPABASE_DATABASE_URL"))
-        typer.echo("✅ Successfully connected to database")
-        return conn
+        with db_conn():
+            typer.echo("✅ Successfully connected to database")
     except Exception as e:
         typer.echo(f"❌ Database connection error: {str(e)}", err=True)
         raise typer.Exit(1)
 
 
-# Ensure the database is seeded before doing anything
-seed_database()
+# The database is seeded lazily on first use rather than at import, so
+# commands that never touch the database don't pay for it.
+SEED_FLAG_FILE = Path.home() / ".aiden" / ".seeded"
+_seed_lock = threading.Lock()
+_seeded = False
+
+
+def _ensure_seeded() -> None:
+    """Seed the database exactly once, recording it in SEED_FLAG_FILE"""
+    global _seeded
+    if _seeded:
+        return
+    with _seed_lock:
+        if not _seeded and not SEED_FLAG_FILE.exists():
+            seed_database()
+            SEED_FLAG_FILE.parent.mkdir(parents=True, exist_ok=True)
+            SEED_FLAG_FILE.touch()
+        _seeded = True
+
+
+@app.command()
+def seed_db():
+    """Seed the database with initial data"""
+    seed_database()
+    typer.echo("✅ Database seeded")
 
 
 # -----------------------------------------------------
@@ -731,52 +757,213 @@ def get_supabase_client():
         return None
 
 
-@app.command()
-def validate_db():
-    """Validate the database connection without exposing credentials."""
-    supabase = get_supabase_client()
+# PostgreSQL connection keywords, read from the environment once at import
+_DB_KW = {
+    "dbname": os.getenv("SUPABASE_DATABASE", "postgres"),
+    "user": os.getenv("SUPABASE_USER"),
+    "password": os.getenv("SUPABASE_PASSWORD"),
+    "host": os.getenv("SUPABASE_HOST"),
+    "port": os.getenv("POSTGRES_PORT", "5432"),
+}
 
-    if not supabase:
-        return
 
-    try:
-        response = supabase.table("users").select("*").limit(1).execute()
+@functools.lru_cache(maxsize=1)
+def _get_pool() -> "pool.ThreadedConnectionPool":
+    """Get the process-wide PostgreSQL pool, connecting on first use"""
+    from psycopg2 import pool
 
-        if response.data:
-            typer.echo("✅ Supabase database connection is valid!")
-        else:
-            typer.echo("⚠️ Connected, but no data found.")
-    except Exception as e:
-        typer.echo(f"❌ Database validation failed: {str(e)}")
+    db_pool = pool.ThreadedConnectionPool(1, 10, **_DB_KW)
+    atexit.register(db_pool.closeall)
+    return db_pool
 
 
 def get_db_connection():
-    """Get a PostgreSQL database connection."""
+    """Get a pooled PostgreSQL database connection.
+
+    Return it with release_db_connection() rather than closing it.
+    """
     try:
-        conn = psycopg2.connect(
-            dbname=os.getenv("SUPABASE_DATABASE", "postgres"),
-            user=os.getenv("SUPABASE_USER"),
-            password=os.getenv("SUPABASE_PASSWORD"),
-            host=os.getenv("SUPABASE_HOST"),
-            port=os.getenv("POSTGRES_PORT", "5432"),
-        )
-        return conn
+        return _get_pool().getconn()
     except Exception as e:
         typer.echo(f"❌ Database connection error: {str(e)}")
         raise
 
 
+def release_db_connection(conn) -> None:
+    """Return a connection from get_db_connection() to the pool"""
+    _get_pool().putconn(conn)
+
+
+_current_conn: contextvars.ContextVar = contextvars.ContextVar("_current_conn", default=None)
+
+
+@contextlib.contextmanager
+def db_conn(readonly: bool = False):
+    """Borrow a pooled PostgreSQL connection for the duration of a block.
+
+    Blocks nested inside another db_conn() reuse the outer connection, and
+    its mode, instead of checking out a second one. A readonly block runs
+    in autocommit mode so plain reads skip the BEGIN/COMMIT round-trips.
+    Anything a block leaves uncommitted is rolled back before the connection
+    goes back to the pool.
+    """
+    from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+    outer = _current_conn.get()
+    if outer is not None:
+        yield outer
+        return
+
+    conn = get_db_connection()
+    token = _current_conn.set(conn)
+    try:
+        if readonly:
+            conn.autocommit = True
+        try:
+            yield conn
+        finally:
+            # Autocommit can only be switched off outside a transaction, so
+            # close any leftover one first
+            if conn.info.transaction_status != TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+            if readonly:
+                conn.autocommit = False
+    finally:
+        _current_conn.reset(token)
+        release_db_connection(conn)
+
+
+def with_conn(readonly: bool = False):
+    """Run a command inside one db_conn() block shared by everything it calls"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with db_conn(readonly=readonly):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Server-side prepared statements, tracked per connection so a backend
+# parses and plans each statement once instead of on every command.
+_prepared_names: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_PLACEHOLDER_RE = re.compile(r"%s")
+_STMT_KEY_RE = re.compile(r"\w+", re.ASCII)
+
+
+def _prepared(cur, key: str, query: str, params=()):
+    """Execute query on cur as the prepared statement stmt_<key>, preparing it on first use"""
+    # The name is spliced into PREPARE/EXECUTE text, so it must be a bare identifier
+    if not _STMT_KEY_RE.fullmatch(key):
+        raise ValueError(f"Invalid prepared statement key: {key!r}")
+    name = f"stmt_{key}"
+    names = _prepared_names.setdefault(cur.connection, set())
+    if name not in names:
+        counter = itertools.count(1)
+        body = _PLACEHOLDER_RE.sub(lambda _: f"${next(counter)}", query)
+        cur.execute(f"PREPARE {name} AS {body}")
+        names.add(name)
+    if params:
+        cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+    else:
+        cur.execute(f"EXECUTE {name}")
+    return cur
+
+
+# SQLite tuning: WAL lets readers and writers overlap and NORMAL sync
+# drops one of the two fsyncs per commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+SQLITE_OPTIMIZE_INTERVAL = 15 * 60
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record=None) -> None:
+    """Apply SQLITE_PRAGMAS to a freshly opened DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def create_db_engine(database_url: str, **kwargs):
+    """Create a SQLAlchemy engine, tuning every SQLite connection on connect."""
+    engine = create_engine(database_url, **kwargs)
+    if database_url.startswith("sqlite"):
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+def schedule_sqlite_optimize(engine, interval: float = SQLITE_OPTIMIZE_INTERVAL) -> None:
+    """Run `PRAGMA optimize` on a SQLite engine every `interval` seconds."""
+    if engine.url.get_backend_name() != "sqlite":
+        return
+
+    def _optimize():
+        try:
+            with engine.connect() as conn:
+                conn.exec_driver_sql("PRAGMA optimize")
+        except Exception as e:
+            logger.warning(f"SQLite optimize failed: {str(e)}")
+        schedule_sqlite_optimize(engine, interval)
+
+    timer = threading.Timer(interval, _optimize)
+    timer.daemon = True
+    timer.start()
+
+
 # Database setup
+@functools.lru_cache(maxsize=1)
+def get_db_engine():
+    """Get the process-wide SQLAlchemy engine, creating it on first use"""
+    DATABASE_URL = os.getenv("SUPABASE_DATABASE_URL")
+    if not DATABASE_URL:
+        raise ValueError("Database URL not found in environment variables")
+
+    if DATABASE_URL.startswith("sqlite"):
+        return create_db_engine(DATABASE_URL, pool_pre_ping=True)
+    return create_db_engine(DATABASE_URL, pool_pre_ping=True, pool_size=5)
+
+
+# Columns added to existing tables after they were first created. create_all
+# only creates missing tables, so these are applied by hand, idempotently.
+SCHEMA_MIGRATIONS = (
+    "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS run_at timestamptz DEFAULT now()",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_run_at ON tasks (run_at)",
+)
+
+
+def _migrate_schema(engine) -> None:
+    """Bring an existing PostgreSQL schema up to date with the ORM models"""
+    from sqlalchemy import inspect, text
+
+    if engine.dialect.name != "postgresql" or not inspect(engine).has_table("tasks"):
+        return
+    with engine.begin() as conn:
+        for statement in SCHEMA_MIGRATIONS:
+            conn.execute(text(statement))
+
+
+@functools.lru_cache(maxsize=1)
+def _session_factory():
+    """Get the sessionmaker bound to the shared engine"""
+    engine = get_db_engine()
+    # Once per process, before any ORM query selects the newer columns
+    _migrate_schema(engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
 def get_db_session():
     """Get SQLAlchemy session for database operations"""
     try:
-        DATABASE_URL = os.getenv("SUPABASE_DATABASE_URL")
-        if not DATABASE_URL:
-            raise ValueError("Database URL not found in environment variables")
-
-        engine = create_engine(DATABASE_URL)
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-        return SessionLocal()
+        _ensure_seeded()
+        return _session_factory()()
     except Exception as e:
         typer.echo(f"❌ Database connection error: {str(e)}", err=True)
         raise typer.Exit(1)
@@ -786,15 +973,39 @@ def get_db_session():
 def init_db() -> None:
     """Initialize the database schema"""
     try:
-        DATABASE_URL = os.getenv("SUPABASE_DATABASE_URL")
-        engine = create_engine(DATABASE_URL)
+        engine = get_db_engine()
         Base.metadata.create_all(bind=engine)
+        _migrate_schema(engine)
         typer.echo("✅ Database schema initialized successfully")
     except Exception as e:
         typer.echo(f"❌ Database initialization error: {str(e)}", err=True)
         raise typer.Exit(1)
 
 
+def _project_row(
+    name: str,
+    description: str,
+    owner_id: int,
+    start_date: Optional[str] = None,
+    due_date: Optional[str] = None,
+) -> dict:
+    """Build a Project insert row, converting YYYY-MM-DD strings to datetimes"""
+    return {
+        "name": name,
+        "description": description,
+        "owner_id": owner_id,
+        "start_date": datetime.strptime(start_date, "%Y-%m-%d") if start_date else None,
+        "due_date": datetime.strptime(due_date, "%Y-%m-%d") if due_date else None,
+    }
+
+
+def create_projects_bulk(db, rows: List[dict]) -> List[int]:
+    """Insert all rows in one executemany and commit once; returns the new IDs"""
+    project_ids = list(db.scalars(insert(Project).returning(Project.id), rows))
+    db.commit()
+    return project_ids
+
+
 @app.command()
 def create_project(
     name: str = typer.Argument(..., help="Project name"),
@@ -806,28 +1017,12 @@ def create_project(
     """Creates a new project with the specified details"""
     try:
         db = get_db_session()
-        
-        # Convert string dates to datetime if provided
-        start_date_dt = (
-            datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
-        )
-        due_date_dt = datetime.strptime(due_date, "%Y-%m-%d") if due_date else None
-
-        # Create new project using SQLAlchemy model
-        project = Project(
-            name=name,
-            description=description,
-            owner_id=owner_id,
-            start_date=start_date_dt,
-            due_date=due_date_dt,
-        )
 
-        db.add(project)
-        db.commit()
-        db.refresh(project)
+        row = _project_row(name, description, owner_id, start_date, due_date)
+        project_id = create_projects_bulk(db, [row])[0]
 
-        typer.echo(f"✅ Project '{name}' created with ID {project.id}")
-        return project.id
+        typer.echo(f"✅ Project '{name}' created with ID {project_id}")
+        return project_id
 
     except Exception as e:
         db.rollback()
@@ -838,72 +1033,60 @@ def create_project(
 
 
 @app.command()
-def list_projects() -> None:
-    """List all projects"""
+def create_projects_from_json(
+    path: str = typer.Argument(..., help="Path to a JSON array of projects"),
+) -> None:
+    """Creates many projects from a JSON file in a single transaction"""
     try:
-        db = get_db_session()
-        projects = db.query(Project).all()
-
-        if not projects:
-            typer.echo("No projects found")
-            return
-
-        for project in projects:
-            typer.echo(
-                f"""
-Project: {project.name} (ID: {project.id})
-  Description: {project.description}
-  Owner ID: {project.owner_id}
-  Start Date: {project.start_date}
-  Due Date: {project.due_date}
-  Created At: {project.created_at}
-"""
+        with open(path, "r") as f:
+            entries = json.load(f)
+        rows = [
+            _project_row(
+                entry["name"],
+                entry.get("description", ""),
+                entry["owner_id"],
+                entry.get("start_date"),
+                entry.get("due_date"),
             )
+            for entry in entries
+        ]
     except Exception as e:
-        typer.echo(f"❌ Error listing projects: {str(e)}", err=True)
+        typer.echo(f"❌ Error reading projects file: {str(e)}", err=True)
         raise typer.Exit(1)
-    finally:
-        db.close()
 
-
-@app.command()
-def create_task(
-    task_name: str = typer.Argument(..., help="Task name"),
-    description: str = typer.Option("", help="Task description"),
-    priority: int = typer.Option(1, help="Task priority (1-5)"),
-    project_id: Optional[int] = typer.Option(None, help="Project ID to assign to"),
-    assigned_to: Optional[int] = typer.Option(None, help="Assign task to user ID"),
-    due_date: Optional[str] = typer.Option(None, help="Due date (YYYY-MM-DD)"),
-):
-    """Creates a new task with optional project and user assignment."""
+    db = get_db_session()
     try:
-        db = get_db_session()
-        
-        task_data = {
-            "task_name": task_name,
-            "description": description,
-            "priority": priority,
-            "assigned_to": assigned_to,
-        }
-        
-        if due_date:
-            task_data["due_date"] = datetime.strptime(due_date, "%Y-%m-%d")
-            
-        task = Task.create(db, **task_data)
-        
-        if project_id:
-            project = Project.get_by_id(db, project_id)
-            if not project:
-                typer.echo(f"❌ Project with ID {project_id} not found")
-                return
-            project.tasks.append(task)
-            db.commit()
-        
-        typer.echo(f"✅ Task '{task_name}' created successfully with ID {task.id}")
-        
+        project_ids = create_projects_bulk(db, rows)
+        typer.echo(f"✅ Created {len(project_ids)} projects")
+        return project_ids
     except Exception as e:
-        typer.echo(f"❌ Error creating task: {str(e)}")
+        db.rollback()
+        typer.echo(f"❌ Error creating projects: {str(e)}", err=True)
         raise typer.Exit(1)
+    finally:
+        db.close()
+
+
+# Listings longer than this many rows are shown through a pager
+PAGER_THRESHOLD = 1000
+LIST_ITERSIZE = 500
+
+_STATUS_EMOJI = {"pending": "⏳", "in-progress": "🔄", "complete": "✅"}
+
+
+def _fmt_due(due_date) -> str:
+    return due_date.strftime("%Y-%m-%d") if due_date else "No due date"
+
+
+def _fmt_task(task) -> str:
+    status_emoji = _STATUS_EMOJI.get(task.status, "⏳")
+    lines = [f"{status_emoji} [{task.id}] {task.task_name} (Priority: {task.priority}) - Due: {_fmt_due(task.due_date)}"]
+    if task.description:
+        lines.append(f"   Description: {task.description}")
+    if task.assigned_to:
+        lines.append(f"   Assigned to: User {task.assigned_to}")
+    lines.append("---\n")
+    return "\n".join(lines)
 
 
 @app.command()
@@ -916,37 +1099,38 @@ def list_tasks(
     """List tasks with optional filters and sorting."""
     try:
         db = get_db_session()
-        query = db.query(Task)
-        
+        # Built from cached lambdas, so SQLAlchemy compiles each
+        # filter/sort combination once and only rebinds the values
+        stmt = lambda_stmt(lambda: select(Task))
+
         if status:
-            query = query.filter(Task.status == status)
+            stmt += lambda s: s.where(Task.status == status)
         if project_id:
-            query = query.join(Task.projects).filter(Project.id == project_id)
+            stmt += lambda s: s.join(Task.projects).where(Project.id == project_id)
         if assigned_to:
-            query = query.filter(Task.assigned_to == assigned_to)
-            
+            stmt += lambda s: s.where(Task.assigned_to == assigned_to)
+
         if sort_by == "priority":
-            query = query.order_by(Task.priority.desc())
+            stmt += lambda s: s.order_by(Task.priority.desc())
         elif sort_by == "due_date":
-            query = query.order_by(Task.due_date)
+            stmt += lambda s: s.order_by(Task.due_date)
         elif sort_by == "created_at":
-            query = query.order_by(Task.created_at)
-            
-        tasks = query.all()
-        
-        if not tasks:
+            stmt += lambda s: s.order_by(Task.created_at)
+
+        # yield_per streams rows through a server-side cursor in batches
+        tasks = db.scalars(stmt, execution_options={"yield_per": LIST_ITERSIZE})
+        head = list(itertools.islice(tasks, PAGER_THRESHOLD + 1))
+
+        if not head:
             typer.echo("No tasks found matching the criteria")
             return
-            
-        for task in tasks:
-            status_emoji = "🔄" if task.status == "in-progress" else "✅" if task.status == "complete" else "⏳"
-            due_date = task.due_date.strftime("%Y-%m-%d") if task.due_date else "No due date"
-            typer.echo(f"{status_emoji} [{task.id}] {task.task_name} (Priority: {task.priority}) - Due: {due_date}")
-            if task.description:
-                typer.echo(f"   Description: {task.description}")
-            if task.assigned_to:
-                typer.echo(f"   Assigned to: User {task.assigned_to}")
-            typer.echo("---")
+
+        # Short listings are written in one go; long ones are paged while
+        # the rest of the result is still being fetched
+        if len(head) > PAGER_THRESHOLD:
+            typer.echo_via_pager(_fmt_task(task) for task in itertools.chain(head, tasks))
+        else:
+            typer.echo("".join(_fmt_task(task) for task in head), nl=False)
             
     except Exception as e:
         typer.echo(f"❌ Error listing tasks: {str(e)}")
@@ -972,6 +1156,17 @@ def ping_server(
     return result
 
 
+# Both caches key on the file's mtime, so an edited config is picked up
+@functools.lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text()
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int) -> dict:
+    return yaml.load(_read_config_file(path, mtime_ns), Loader=_YamlLoader)
+
+
 # -----------------------------------------------------
 # 2) show_config
 # -----------------------------------------------------
@@ -983,16 +1178,18 @@ def show_config(
     Shows the current configuration from modules/assistant_config.py.
     """
     try:
-
-        config = ""
-
-        with open("../assistant_config.yml", "r") as f:
-            config = f.read()
-
+        # The same file get_config reads
+        config_path = resolve_config_path()
+        mtime_ns = os.stat(config_path).st_mtime_ns
         if verbose:
-            result = f"Verbose config:\n{json.dumps(yaml.safe_load(config), indent=2)}"
+            config = _parse_config_file(config_path, mtime_ns)
+            result = f"Verbose config:\n{json.dumps(config, indent=2)}"
         else:
-            result = f"Config: {config}"
+            result = f"Config: {_read_config_file(config_path, mtime_ns)}"
+        typer.echo(result)
+        return result
+    except FileNotFoundError:
+        result = f"Error: Config file not found at {config_path}"
         typer.echo(result)
         return result
     except ImportError:
@@ -1012,24 +1209,28 @@ def list_files(
     """
     Lists files in a directory. Optionally show hidden files.
     """
-    if not os.path.isdir(path):
+    try:
+        with os.scandir(path) as it:
+            entries = [e.name for e in it if all_files or not e.name.startswith(".")]
+    except (FileNotFoundError, NotADirectoryError):
         msg = f"Path '{path}' is not a valid directory."
         typer.echo(msg)
         return msg
 
-    entries = os.listdir(path)
-    if not all_files:
-        entries = [e for e in entries if not e.startswith(".")]
-
     result = f"Files in '{path}': {entries}"
     typer.echo(result)
     return result
 
 
+# ORDER BY can't be a bind parameter, so sort keys map onto fixed columns
+USER_SORT_COLS = {"username": "username", "role": "role", "created_at": "created_at"}
+
+
 # -----------------------------------------------------
 # 3.5) list_users
 # -----------------------------------------------------
 @app.command()
+@with_conn(readonly=True)
 def list_users(
     role: str = typer.Option(None, "--role", help="Filter users by role"),
     sort: str = typer.Option(
@@ -1039,9 +1240,11 @@ def list_users(
     """
     Lists all users, optionally filtered by role and sorted by specified field.
     """
-    conn = get_connection()
-    cur = conn.cursor()
+    if sort not in USER_SORT_COLS:
+        typer.echo(f"⚠️ Invalid sort field. Must be one of {list(USER_SORT_COLS)}.")
+        return
 
+    # One prepared statement per (filter, sort column) combination
     query = "SELECT username, role, created_at FROM users"
     params = []
 
@@ -1049,11 +1252,11 @@ def list_users(
         query += " WHERE role = %s"
         params.append(role)
 
-    query += f" ORDER BY {sort}"
+    query += f" ORDER BY {USER_SORT_COLS[sort]}"
 
-    cur.execute(query, params)
-    users = cur.fetchall()
-    conn.close()
+    with db_conn() as conn, conn.cursor() as cur:
+        _prepared(cur, f"list_users_{'role' if role else 'all'}_{sort}", query, params)
+        users = cur.fetchall()
 
     if not users:
         result = "No users found."
@@ -1061,9 +1264,8 @@ def list_users(
         return result
 
     # Format output
-    result = "Users:\n"
-    for user in users:
-        result += f"- {user[0]} (Role: {user[1]}, Created: {user[2]})\n"
+    lines = [f"- {user[0]} (Role: {user[1]}, Created: {user[2]})" for user in users]
+    result = "Users:\n" + "\n".join(lines) + "\n"
 
     typer.echo(result)
     return result
@@ -1080,15 +1282,15 @@ def create_user(
     """
     Creates a new user with an optional role.
     """
-    conn = get_connection()
-    cur = conn.cursor()
-    now = datetime.now().isoformat()
-    cur.execute(
-        "INSERT INTO users (username, role, created_at) VALUES (%s, %s, %s)",
-        (username, role, now),
-    )
-    conn.commit()
-    conn.close()
+    # created_at is filled in by the column's server default
+    with db_conn() as conn, conn.cursor() as cur:
+        _prepared(
+            cur,
+            "create_user",
+            "INSERT INTO users (username, role) VALUES (%s, %s)",
+            (username, role),
+        )
+        conn.commit()
     result = f"User '{username}' created with role '{role}'."
     typer.echo(result)
     return result
@@ -1110,12 +1312,10 @@ def delete_user(
         typer.echo(f"Confirmation needed to delete user {user_id}. Use --confirm.")
         return f"Deletion of user {user_id} not confirmed."
 
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM users WHERE id = %s", (user_id,))
-    conn.commit()
-    changes = cur.rowcount
-    conn.close()
+    with db_conn() as conn, conn.cursor() as cur:
+        _prepared(cur, "delete_user", "DELETE FROM users WHERE id = %s", (user_id,))
+        conn.commit()
+        changes = cur.rowcount
 
     if changes > 0:
         msg = f"User with ID {user_id} deleted."
@@ -1125,6 +1325,9 @@ def delete_user(
     return msg
 
 
+REPORT_ITERSIZE = 10_000
+
+
 # -----------------------------------------------------
 # 6) generate_report
 # -----------------------------------------------------
@@ -1132,44 +1335,97 @@ def delete_user(
 def generate_report(
     table_name: str = typer.Argument(..., help="Name of table to generate report from"),
     output_file: str = typer.Option("report.json", "--output", help="Output file name"),
+    limit: Optional[int] = typer.Option(None, "--limit", help="Only report this many rows"),
+    offset: int = typer.Option(0, "--offset", help="Skip this many rows first"),
 ):
     """
     Generates a report from an existing database table and saves it to a file.
     """
-    conn = get_connection()
-    cur = conn.cursor()
+    import shutil
 
-    # Get all data from the specified table
-    cur.execute(f"SELECT * FROM {table_name}")
-    rows = cur.fetchall()
+    from psycopg2 import sql
 
-    # Get column names from cursor description
-    columns = [description[0] for description in cur.description]
+    with db_conn() as conn, open(output_file, "wb") as f:
+        # A named (server-side) cursor streams rows in batches of itersize
+        # instead of pulling the whole table into memory
+        with conn.cursor(name="report_cur") as cur:
+            cur.itersize = REPORT_ITERSIZE
+            # The page is cut by the server; LIMIT NULL means no limit
+            cur.execute(
+                sql.SQL("SELECT * FROM {} LIMIT %s OFFSET %s").format(sql.Identifier(table_name)),
+                (limit, offset),
+            )
 
-    # Convert rows to list of dicts with column names
-    data = []
-    for row in rows:
-        data.append(dict(zip(columns, row)))
+            # Written piece by piece with the same two-space indentation a
+            # whole-document OPT_INDENT_2 dump would have; orjson escapes
+            # newlines inside strings, so every raw newline is structural
+            f.write(
+                b'{\n  "table": %s,\n  "timestamp": %s,\n  "data": ['
+                % (orjson.dumps(table_name), orjson.dumps(datetime.now()))
+            )
+            columns = None
+            row_count = 0
+            for row in cur:
+                if columns is None:
+                    columns = [description[0] for description in cur.description]
+                f.write(b",\n    " if row_count else b"\n    ")
+                f.write(
+                    orjson.dumps(
+                        dict(zip(columns, row)),
+                        default=str,
+                        option=orjson.OPT_NAIVE_UTC | orjson.OPT_INDENT_2,
+                    ).replace(b"\n", b"\n    ")
+                )
+                row_count += 1
+            if columns is None:
+                columns = [d[0] for d in cur.description] if cur.description else []
+
+        f.write(
+            b'%s],\n  "columns": %s,\n  "row_count": %d\n}\n'
+            % (
+                b"\n  " if row_count else b"",
+                orjson.dumps(columns, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "),
+                row_count,
+            )
+        )
 
     report_data = {
         "table": table_name,
-        "timestamp": datetime.now().isoformat(),
         "columns": columns,
-        "row_count": len(rows),
-        "data": data,
+        "row_count": row_count,
+        "output_file": output_file,
     }
 
-    with open(output_file, "w") as f:
-        json.dump(report_data, f, indent=2)
-
-    conn.close()
-
-    result = f"Report for table '{table_name}' generated and saved to {output_file}."
+    result = f"Report for table '{table_name}' ({row_count} rows) generated and saved to {output_file}."
     typer.echo(result)
-    typer.echo(json.dumps(report_data, indent=2))
+    # Echo the report by copying the file in blocks rather than encoding the
+    # rows a second time
+    stdout = typer.get_binary_stream("stdout")
+    with open(output_file, "rb") as f:
+        shutil.copyfileobj(f, stdout)
+    stdout.flush()
     return report_data
 
 
+def _copy_file(src: str, dst: str) -> None:
+    """Copy src to dst in the kernel with copy_file_range where available"""
+    import shutil
+
+    if not hasattr(os, "copy_file_range"):
+        shutil.copyfile(src, dst)
+        return
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                pass
+        except OSError:
+            # e.g. copying across filesystems on older kernels
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+
+
 # -----------------------------------------------------
 # 7) backup_data
 # -----------------------------------------------------
@@ -1188,7 +1444,17 @@ def backup_data(
     backup_file = os.path.join(
         directory, f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
     )
-    shutil.copy(DB_NAME, backup_file)
+    import sqlite3
+
+    # SQLite's online backup gives a consistent snapshot even if the
+    # database is open and being written to
+    src = sqlite3.connect(DB_NAME)
+    dst = sqlite3.connect(backup_file)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
 
     result = (
         f"{'Full' if full else 'Partial'} backup completed. Saved to {backup_file}."
@@ -1210,17 +1476,17 @@ def restore_data(
     """
     Restores data from a backup file.
     """
-    if not os.path.isfile(file_path):
-        msg = f"Backup file {file_path} does not exist."
-        typer.echo(msg)
-        return msg
-
     if not overwrite:
         msg = "Overwrite not confirmed. Use --overwrite to proceed."
         typer.echo(msg)
         return msg
 
-    shutil.copy(file_path, "database.db")
+    try:
+        _copy_file(file_path, "database.db")
+    except FileNotFoundError:
+        msg = f"Backup file {file_path} does not exist."
+        typer.echo(msg)
+        return msg
     msg = f"Data restored from {file_path} to database.db."
     typer.echo(msg)
     return msg
@@ -1233,20 +1499,25 @@ def restore_data(
 def summarize_logs(
     logs_path: str = typer.Argument(..., help="Path to log files"),
     lines: int = typer.Option(100, "--lines", help="Number of lines to summarize"),
+    tail: bool = typer.Option(False, "--tail", help="Show the last lines instead"),
 ):
     """
     Summarizes log data from a specified path, limiting lines.
     """
-    if not os.path.isfile(logs_path):
-        msg = f"Log file {logs_path} not found."
+    try:
+        if tail:
+            snippet = tail_lines(logs_path, lines)
+        else:
+            # Only read as many lines as we show, however large the log is
+            with open(logs_path, "r", buffering=1 << 20) as f:
+                snippet = list(itertools.islice(f, lines))
+    except FileNotFoundError:
+        msg = f"Log file {logs_path} not found."
         typer.echo(msg)
         return msg
 
-    with open(logs_path, "r") as f:
-        all_lines = f.readlines()
-
-    snippet = all_lines[:lines]
-    result = f"Showing first {lines} lines from {logs_path}:\n" + "".join(snippet)
+    which = "last" if tail else "first"
+    result = f"Showing {which} {lines} lines from {logs_path}:\n" + "".join(snippet)
     typer.echo(result)
     return result
 
@@ -1276,32 +1547,70 @@ def upload_file(
     return result
 
 
+DOWNLOAD_CONCURRENCY = 64
+
+
+def _write_download(url: str, filename: str) -> None:
+    # In real scenario, you'd do requests, etc. We'll just mock it.
+    with open(filename, "w") as f:
+        f.write("Downloaded data from " + url)
+
+
+async def _download_one(
+    sem: asyncio.Semaphore, url: str, output_path: str, retry: int
+) -> str:
+    """Download one URL, retrying up to `retry` times on I/O errors"""
+    filename = os.path.join(output_path, os.path.basename(url))
+    async with sem:
+        for attempt in range(retry + 1):
+            try:
+                await asyncio.to_thread(_write_download, url, filename)
+                return filename
+            except OSError:
+                if attempt == retry:
+                    raise
+                await asyncio.sleep(2**attempt * 0.1)
+
+
+async def _download_batch(urls: List[str], output_path: str, retry: int) -> List[str]:
+    """Download all URLs concurrently, bounded by DOWNLOAD_CONCURRENCY"""
+    sem = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+    return await asyncio.gather(
+        *(_download_one(sem, url, output_path, retry) for url in urls)
+    )
+
+
 # -----------------------------------------------------
 # 11) download_file
 # -----------------------------------------------------
 @app.command()
 def download_file(
-    url: str = typer.Argument(..., help="URL of file to download"),
+    urls: List[str] = typer.Argument(..., help="URL(s) of file(s) to download"),
     output_path: str = typer.Option(".", "--output", help="Local output path"),
     retry: int = typer.Option(3, "--retry", help="Number of times to retry"),
 ):
     """
-    Downloads a file from a URL with a specified number of retries.
+    Downloads one or more files concurrently, each with a specified number of retries.
     """
-    # In real scenario, you'd do requests, etc. We'll just mock it.
-    filename = os.path.join(output_path, os.path.basename(url))
-    with open(filename, "w") as f:
-        f.write("Downloaded data from " + url)
+    filenames = asyncio.run(_download_batch(urls, output_path, retry))
 
-    result = f"File downloaded from {url} to {filename} with {retry} retries allowed."
+    result = "\n".join(
+        f"File downloaded from {url} to {filename} with {retry} retries allowed."
+        for url, filename in zip(urls, filenames)
+    )
     typer.echo(result)
     return result
 
 
+# Tables filter_records may search, and the text column matched in each
+FILTER_TABLES = {"users": "username", "logs": "message", "tasks": "task_name"}
+
+
 # -----------------------------------------------------
 # 12) filter_records
 # -----------------------------------------------------
 @app.command()
+@with_conn(readonly=True)
 def filter_records(
     source: str = typer.Argument(..., help="Data source to filter"),
     query: str = typer.Option("", "--query", help="Filtering query string"),
@@ -1311,29 +1620,24 @@ def filter_records(
     Filters records from a data source using a query, limiting the number of results.
     Example usage: filter_records table_name --query "admin" --limit 5
     """
-    conn = get_connection()
-    cur = conn.cursor()
+    import psycopg2
+    from psycopg2 import sql
+
+    if source not in FILTER_TABLES:
+        typer.echo(f"Unknown table: {source}")
+        return f"Table '{source}' not recognized."
 
     # For demonstration, we'll assume the 'source' is a table name in the DB
     # and the 'query' is a substring to match against username or message, etc.
-    # This is just a simple example.
+    # The composed SQL is fixed per table, so each one prepares only once.
     try:
-        sql = f"SELECT * FROM {source} WHERE "
-        if source == "users":
-            sql += "username ILIKE %s"
-        elif source == "logs":
-            sql += "message ILIKE %s"
-        elif source == "tasks":
-            sql += "task_name ILIKE %s"
-        else:
-            typer.echo(f"Unknown table: {source}")
-            return f"Table '{source}' not recognized."
-
-        sql += f" LIMIT {limit}"
-
-        wildcard_query = f"%{query}%"
-        cur.execute(sql, (wildcard_query,))
-        rows = cur.fetchall()
+        with db_conn() as conn, conn.cursor() as cur:
+            stmt = sql.SQL("SELECT * FROM {} WHERE {} ILIKE %s LIMIT %s").format(
+                sql.Identifier(source), sql.Identifier(FILTER_TABLES[source])
+            )
+            wildcard_query = f"%{query}%"
+            _prepared(cur, f"filter_{source}", stmt.as_string(cur), (wildcard_query, limit))
+            rows = cur.fetchall()
 
         result = (
             f"Found {len(rows)} records in '{source}' with query '{query}'.\n{rows}"
@@ -1345,8 +1649,23 @@ def filter_records(
         msg = f"Database error: {e}"
         typer.echo(msg)
         return msg
+
+
+def _sha256(f) -> bytes:
+    """Stream an open binary file through SHA-256"""
+    import hashlib
+
+    return hashlib.file_digest(f, "sha256").digest()
+
+
+def _text_lines(f) -> List[str]:
+    """Read a binary file's lines as text mode would, with \\n line endings"""
+    # Undecodable bytes show up as U+FFFD in the diff instead of aborting it
+    text = io.TextIOWrapper(f, encoding="utf-8", errors="replace")
+    try:
+        return text.readlines()
     finally:
-        conn.close()
+        text.detach()
 
 
 # -----------------------------------------------------
@@ -1363,24 +1682,33 @@ def compare_files(
     """
     Compares two files, optionally showing only differences.
     """
-    if not os.path.isfile(file_a) or not os.path.isfile(file_b):
-        msg = f"One or both files do not exist: {file_a}, {file_b}"
-        typer.echo(msg)
-        return msg
-
-    with open(file_a, "r") as fa, open(file_b, "r") as fb:
-        lines_a = fa.readlines()
-        lines_b = fb.readlines()
+    with contextlib.ExitStack() as stack:
+        try:
+            fa = stack.enter_context(open(file_a, "rb"))
+            fb = stack.enter_context(open(file_b, "rb"))
+        except FileNotFoundError:
+            msg = f"One or both files do not exist: {file_a}, {file_b}"
+            typer.echo(msg)
+            return msg
+
+        # Byte-identical files never need a line diff
+        if os.fstat(fa.fileno()).st_size == os.fstat(fb.fileno()).st_size:
+            if _sha256(fa) == _sha256(fb):
+                typer.echo("Files are identical.")
+                return ""
+            fa.seek(0)
+            fb.seek(0)
+
+        lines_a = _text_lines(fa)
+        lines_b = _text_lines(fb)
+
+    import difflib
 
     diff = difflib.unified_diff(lines_a, lines_b, fromfile=file_a, tofile=file_b)
 
     if diff_only:
         # Show only differences
-        differences = []
-        for line in diff:
-            if line.startswith("+") or line.startswith("-"):
-                differences.append(line)
-        result = "\n".join(differences)
+        result = "\n".join(line for line in diff if line.startswith(("+", "-")))
     else:
         # Show entire unified diff
         result = "".join(diff)
@@ -1389,6 +1717,15 @@ def compare_files(
     return result
 
 
+def _read_required(path: str) -> Optional[str]:
+    """Read a text file, or return None if it doesn't exist"""
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
 # -----------------------------------------------------
 # 17) encrypt_data
 # -----------------------------------------------------
@@ -1401,14 +1738,12 @@ def encrypt_data(
     """
     Encrypts data using a specified algorithm (mocked by Caesar cipher here).
     """
-    if not os.path.isfile(input_path):
+    data = _read_required(input_path)
+    if data is None:
         msg = f"File {input_path} not found."
         typer.echo(msg)
         return msg
 
-    with open(input_path, "r") as f:
-        data = f.read()
-
     # We'll just mock the encryption using Caesar cipher
     encrypted = caesar_cipher_encrypt(data, 3)
 
@@ -1432,14 +1767,12 @@ def decrypt_data(
     """
     Decrypts an encrypted file using a key (ignored in this mock Caesar cipher).
     """
-    if not os.path.isfile(encrypted_file):
+    encrypted_data = _read_required(encrypted_file)
+    if encrypted_data is None:
         msg = f"Encrypted file {encrypted_file} not found."
         typer.echo(msg)
         return msg
 
-    with open(encrypted_file, "r") as f:
-        encrypted_data = f.read()
-
     # Key is ignored in this Caesar cipher demo
     decrypted = caesar_cipher_decrypt(encrypted_data, 3)
 
@@ -1475,6 +1808,8 @@ def migrate_database(
         typer.echo(result)
         return result
 
+    import shutil
+
     shutil.copy(old_db, new_db)
     result = f"Database migrated from {old_db} to {new_db}."
     typer.echo(result)
@@ -1493,20 +1828,22 @@ def queue_task(
     """Queues a task with a specified priority and optional delay."""
     try:
         db = get_db_session()
-        
+
+        # The delay is stored as run_at for `run_queue` to honour, so this
+        # command returns immediately instead of sleeping
         task = Task(
             task_name=task_name,
             priority=priority,
-            status="pending"
+            status="pending",
+            run_at=datetime.now(timezone.utc) + timedelta(seconds=delay),
         )
-        
+
         db.add(task)
         db.commit()
-        
+
         if delay > 0:
             typer.echo(f"⏰ Task will start in {delay} seconds")
-            time.sleep(delay)
-            
+
         typer.echo(f"✅ Task '{task_name}' queued successfully with ID {task.id}")
         return task.id
         
@@ -1515,9 +1852,48 @@ def queue_task(
         raise typer.Exit(1)
 
 
+@app.command()
+def run_queue(
+    poll_interval: float = typer.Option(1.0, help="Seconds between queue polls"),
+    batch_size: int = typer.Option(32, help="Maximum tasks claimed per poll"),
+    once: bool = typer.Option(False, "--once", help="Process due tasks once and exit"),
+):
+    """Starts queued tasks once their run_at time has passed."""
+    db = get_db_session()
+    try:
+        while True:
+            # SKIP LOCKED lets several workers drain the queue without
+            # blocking on each other's claimed rows
+            due = (
+                db.query(Task)
+                .filter(Task.status == "pending", Task.run_at <= func.now())
+                .order_by(Task.priority.desc(), Task.run_at)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            for task in due:
+                task.status = "in-progress"
+                typer.echo(f"▶️ Started task '{task.task_name}' (ID {task.id})")
+            db.commit()
+
+            if once:
+                return len(due)
+            if len(due) < batch_size:
+                time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        db.rollback()
+    except Exception as e:
+        db.rollback()
+        typer.echo(f"❌ Error running task queue: {str(e)}")
+        raise typer.Exit(1)
+    finally:
+        db.close()
+
+
 @app.command("list tasks")
 def handle_list_tasks():
-    typer.invoke("task list")
+    list_tasks(status=None, project_id=None, assigned_to=None, sort_by="priority")
 
 
 # -----------------------------------------------------
@@ -1533,12 +1909,10 @@ def remove_task(
         typer.echo(f"Confirmation required to remove task {task_id}. Use --force.")
         return
 
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM tasks WHERE id = %s", (task_id,))
-    conn.commit()
-    removed = cur.rowcount
-    conn.close()
+    with db_conn() as conn, conn.cursor() as cur:
+        _prepared(cur, "remove_task", "DELETE FROM tasks WHERE id = %s", (task_id,))
+        conn.commit()
+        removed = cur.rowcount
 
     if removed:
         typer.echo(f"✅ Task {task_id} removed.")
@@ -1546,49 +1920,8 @@ def remove_task(
         typer.echo(f"⚠️ Task {task_id} not found.")
 
 
-# -----------------------------------------------------
-# 29) list_tasks
-# -----------------------------------------------------
-@app.command()
-def list_tasks(
-    show_all: bool = typer.Option(
-        False, "--all", help="Show all tasks, including completed"
-    ),
-    sort_by: str = typer.Option(
-        "priority", "--sort-by", help="Sort tasks by this field"
-    ),
-):
-    """Lists tasks, optionally including completed tasks or sorting by a different field."""
-
-    valid_sort_fields = ["priority", "status", "created_at"]
-    if sort_by not in valid_sort_fields:
-        typer.echo(f"⚠️ Invalid sort field. Must be one of {valid_sort_fields}.")
-        return
-
-    conn = get_connection()
-    cur = conn.cursor()
-    if show_all:
-        sql = f"SELECT id, task_name, priority, status, created_at FROM tasks ORDER BY {sort_by} ASC"
-    else:
-        sql = f"SELECT id, task_name, priority, status, created_at FROM tasks WHERE status != 'complete' ORDER BY {sort_by} ASC"
-
-    cur.execute(sql)
-    tasks = cur.fetchall()
-    conn.close()
-
-    if not tasks:
-        typer.echo("⚠️ No tasks found.")
-        return
-
-    result = "📌 Tasks:\n"
-    for t in tasks:
-        result += f"🆔 ID={t[0]}, 📌 Name={t[1]}, 🔥 Priority={t[2]}, ✅ Status={t[3]}, 🕒 Created={t[4]}\n"
-
-    typer.echo(result.strip())
-    return result
-
-
 @app.command()
+@with_conn(readonly=True)
 def inspect_task(
     task_id: int = typer.Argument(..., help="ID of the task to inspect"),
     json_output: bool = typer.Option(
@@ -1596,14 +1929,14 @@ def inspect_task(
     ),
 ):
     """Inspects a specific task by ID, optionally in JSON format."""
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT id, task_name, priority, status, created_at FROM tasks WHERE id = %s",
-        (task_id,),
-    )
-    row = cur.fetchone()
-    conn.close()
+    with db_conn() as conn, conn.cursor() as cur:
+        _prepared(
+            cur,
+            "inspect_task",
+            "SELECT id, task_name, priority, status, created_at FROM tasks WHERE id = %s",
+            (task_id,),
+        )
+        row = cur.fetchone()
 
     if not row:
         typer.echo(f"⚠️ No task found with ID {task_id}.")
@@ -1618,7 +1951,7 @@ def inspect_task(
     }
 
     if json_output:
-        result = json.dumps(task_dict, indent=2)
+        result = orjson.dumps(task_dict, option=orjson.OPT_INDENT_2).decode()
     else:
         result = f"🆔 Task ID={task_dict['id']}, 📌 Name={task_dict['task_name']}, 🔥 Priority={task_dict['priority']}, ✅ Status={task_dict['status']}, 🕒 Created={task_dict['created_at']}"
     typer.echo(result)
@@ -1634,22 +1967,20 @@ def create_goal(
     project_id: Optional[int] = typer.Option(None, help="Associated project ID"),
 ):
     """Creates a new goal with optional project association."""
-    conn = get_connection()
-    cur = conn.cursor()
-    now = datetime.now().isoformat()
-
-    cur.execute(
-        """
-    INSERT INTO goals (title, description, category, target_date, project_id, created_at)
-    VALUES (%s, %s, %s, %s, %s, %s)
-    RETURNING id
-    """,
-        (title, description, category, target_date, project_id, now),
-    )
+    with db_conn() as conn, conn.cursor() as cur:
+        _prepared(
+            cur,
+            "create_goal",
+            """
+        INSERT INTO goals (title, description, category, target_date, project_id)
+        VALUES (%s, %s, %s, %s, %s)
+        RETURNING id
+        """,
+            (title, description, category, target_date, project_id),
+        )
 
-    goal_id = cur.fetchone()[0]
-    conn.commit()
-    conn.close()
+        goal_id = cur.fetchone()[0]
+        conn.commit()
 
     result = f"🎯 Goal '{title}' created with ID {goal_id}."
     typer.echo(result)
@@ -1670,34 +2001,32 @@ def create_event(
     ),
 ):
     """Creates a new calendar event."""
-    conn = get_connection()
-    cur = conn.cursor()
-    now = datetime.now().isoformat()
-
-    cur.execute(
-        """
-    INSERT INTO calendar_events (
-        title, start_time, end_time, description, location, 
-        event_type, project_id, recurring, created_at
-    )
-    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """,
-        (
-            title,
-            start_time,
-            end_time,
-            description,
-            location,
-            event_type,
-            project_id,
-            recurring,
-            now,
-        ),
-    )
+    with db_conn() as conn, conn.cursor() as cur:
+        _prepared(
+            cur,
+            "create_event",
+            """
+        INSERT INTO calendar_events (
+            title, start_time, end_time, description, location,
+            event_type, project_id, recurring
+        )
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        RETURNING id
+        """,
+            (
+                title,
+                start_time,
+                end_time,
+                description,
+                location,
+                event_type,
+                project_id,
+                recurring,
+            ),
+        )
 
-    event_id = cur.lastrowid
-    conn.commit()
-    conn.close()
+        event_id = cur.fetchone()[0]
+        conn.commit()
     return f"Event '{title}' created with ID {event_id}"
 
 
@@ -1707,26 +2036,24 @@ def add_task_dependency(
     dependent_on_id: int = typer.Argument(..., help="ID of task this depends on"),
 ):
     """Adds a dependency relationship between two tasks."""
-    conn = get_connection()
-    cur = conn.cursor()
-    now = datetime.now().isoformat()
-
-    # Verify both tasks exist
-    cur.execute("SELECT id FROM tasks WHERE id IN (%s, %s)", (task_id, dependent_on_id))
-    if len(cur.fetchall()) != 2:
-        conn.close()
-        return "One or both tasks not found"
-
-    cur.execute(
-        """
-    INSERT INTO task_dependencies (task_id, dependent_on_id, created_at)
-    VALUES (%s, %s, %s)
-    """,
-        (task_id, dependent_on_id, now),
-    )
+    with db_conn() as conn, conn.cursor() as cur:
+        # The join doubles as the existence check, so verifying both tasks
+        # and inserting the dependency is a single round-trip
+        _prepared(
+            cur,
+            "add_task_dependency",
+            """
+        INSERT INTO task_dependencies (task_id, dependent_on_id)
+        SELECT t.id, d.id FROM tasks t, tasks d
+        WHERE t.id = %s AND d.id = %s AND t.id <> d.id
+        RETURNING task_id
+        """,
+            (task_id, dependent_on_id),
+        )
+        if cur.fetchone() is None:
+            return "One or both tasks not found"
 
-    conn.commit()
-    conn.close()
+        conn.commit()
     return f"Dependency added: Task {task_id} now depends on Task {dependent_on_id}"
 
 
@@ -1739,7 +2066,13 @@ def list_project_tasks(
     try:
         db = get_db_session()
         
-        project = Project.get_by_id(db, project_id)
+        # Load the project's tasks in one extra IN query rather than lazily
+        project = (
+            db.query(Project)
+            .options(selectinload(Project.tasks))
+            .filter(Project.id == project_id)
+            .first()
+        )
         if not project:
             typer.echo(f"❌ Project with ID {project_id} not found")
             return
@@ -1754,8 +2087,8 @@ def list_project_tasks(
             
         typer.echo(f"\n📋 Tasks for project '{project.name}':")
         for task in tasks:
-            status_emoji = "🔄" if task.status == "in-progress" else "✅" if task.status == "complete" else "⏳"
-            due_date = task.due_date.strftime("%Y-%m-%d") if task.due_date else "No due date"
+            status_emoji = _STATUS_EMOJI.get(task.status, "⏳")
+            due_date = _fmt_due(task.due_date)
             typer.echo(f"{status_emoji} [{task.id}] {task.task_name} (Priority: {task.priority}) - Due: {due_date}")
             if task.description:
                 typer.echo(f"   Description: {task.description}")
@@ -1772,6 +2105,10 @@ def list_project_tasks(
 # Task Management Commands
 # -----------------------------------------------------
 
+TASK_INSERT_SQL = (
+    "INSERT INTO tasks (task_name, description, priority, status, user_id) VALUES"
+)
+
 
 @app.command()
 def create_task(
@@ -1781,106 +2118,100 @@ def create_task(
     user_id: Optional[int] = typer.Option(None, help="Assign task to user ID"),
 ):
     """Create a new task."""
-    conn = get_db_connection()
-    cur = conn.cursor()
-
     try:
-        cur.execute(
-            """
-            INSERT INTO tasks (task_name, description, priority, status, user_id)
-            VALUES (%s, %s, %s, %s, %s)
-            RETURNING id
-        """,
-            (name, description, priority, "pending", user_id),
-        )
+        with db_conn() as conn, conn.cursor() as cur:
+            _prepared(
+                cur,
+                "create_task",
+                f"{TASK_INSERT_SQL} (%s, %s, %s, %s, %s) RETURNING id",
+                (name, description, priority, "pending", user_id),
+            )
 
-        task_id = cur.fetchone()[0]
-        conn.commit()
+            task_id = cur.fetchone()[0]
+            conn.commit()
         typer.echo(f"✅ Task '{name}' created with ID {task_id}")
         return task_id
     except Exception as e:
         typer.echo(f"❌ Failed to create task: {str(e)}")
-    finally:
-        cur.close()
-        conn.close()
 
 
 @app.command()
-def list_tasks(
-    status: str = typer.Option(
-        None, help="Filter by status (pending, in-progress, complete)"
+def create_tasks_from_csv(
+    path: str = typer.Argument(
+        ..., help="CSV with task_name, description, priority, user_id columns"
     ),
-    user_id: int = typer.Option(None, help="Filter by assigned user"),
 ):
-    """List all tasks with optional filters."""
-    conn = get_db_connection()
-    cur = conn.cursor()
+    """Create many tasks from a CSV file in a single round-trip batch."""
+    import csv
 
-    try:
-        query = """
-            SELECT t.id, t.task_name, t.description, t.priority, t.status, 
-                   t.created_at, u.username as assigned_to
-            FROM tasks t
-            LEFT JOIN users u ON t.user_id = u.id
-            WHERE 1=1
-        """
-        params = []
+    from psycopg2.extras import execute_values
 
-        if status:
-            query += " AND t.status = %s"
-            params.append(status)
+    try:
+        with open(path, newline="") as f:
+            rows = [
+                (
+                    row["task_name"],
+                    row.get("description") or "",
+                    int(row.get("priority") or 1),
+                    "pending",
+                    int(row["user_id"]) if row.get("user_id") else None,
+                )
+                for row in csv.DictReader(f)
+            ]
+    except Exception as e:
+        typer.echo(f"❌ Error reading tasks file: {str(e)}", err=True)
+        raise typer.Exit(1)
 
-        if user_id:
-            query += " AND t.user_id = %s"
-            params.append(user_id)
+    with db_conn() as conn, conn.cursor() as cur:
+        try:
+            # One multi-row INSERT per page instead of a statement per task
+            task_ids = execute_values(
+                cur, f"{TASK_INSERT_SQL} %s RETURNING id", rows, page_size=1000, fetch=True
+            )
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            typer.echo(f"❌ Failed to create tasks: {str(e)}", err=True)
+            raise typer.Exit(1)
 
-        cur.execute(query, params)
-        tasks = cur.fetchall()
+    typer.echo(f"✅ Created {len(task_ids)} tasks")
+    return [task_id for (task_id,) in task_ids]
 
-        if not tasks:
-            typer.echo("No tasks found.")
-            return
 
-        for task in tasks:
-            typer.echo(f"📋 Task #{task[0]}: {task[1]}")
-            typer.echo(f"  Description: {task[2]}")
-            typer.echo(f"  Priority: {task[3]}")
-            typer.echo(f"  Status: {task[4]}")
-            typer.echo(f"  Created: {task[5]}")
-            typer.echo(f"  Assigned to: {task[6] or 'Unassigned'}")
-            typer.echo("---")
-    except Exception as e:
-        typer.echo(f"❌ Failed to list tasks: {str(e)}")
-    finally:
-        cur.close()
-        conn.close()
+def _copy_project_tasks(project_id: int, task_ids: List[int]) -> None:
+    """Link task_ids to project_id with a single COPY"""
+    buf = io.StringIO("".join(f"{project_id},{task_id}\n" for task_id in task_ids))
+    with db_conn() as conn, conn.cursor() as cur:
+        cur.copy_expert("COPY project_tasks (project_id, task_id) FROM STDIN WITH (FORMAT csv)", buf)
+        conn.commit()
 
 
 @app.command()
+@with_conn()
 def assign_task(
     task_id: int = typer.Argument(..., help="Task ID to assign"),
     project_id: int = typer.Argument(..., help="Project ID to assign to"),
 ):
     """Assign a task to a project."""
-    conn = get_db_connection()
-    cur = conn.cursor()
-
     try:
-        cur.execute(
-            """
-            INSERT INTO project_tasks (project_id, task_id)
-            VALUES (%s, %s)
-        """,
-            (project_id, task_id),
-        )
-
-        conn.commit()
+        _copy_project_tasks(project_id, [task_id])
         typer.echo(f"✅ Task {task_id} assigned to project {project_id}")
     except Exception as e:
         typer.echo(f"❌ Failed to assign task: {str(e)}")
-    finally:
-        cur.close()
-        conn.close()
+
+
+@app.command()
+@with_conn()
+def assign_tasks_bulk(
+    project_id: int = typer.Argument(..., help="Project ID to assign to"),
+    task_ids: List[int] = typer.Argument(..., help="Task IDs to assign"),
+):
+    """Assign many tasks to a project in one COPY."""
+    try:
+        _copy_project_tasks(project_id, task_ids)
+        typer.echo(f"✅ {len(task_ids)} tasks assigned to project {project_id}")
+    except Exception as e:
+        typer.echo(f"❌ Failed to assign tasks: {str(e)}")
 
 
 # -----------------------------------------------------
@@ -1888,125 +2219,115 @@ def assign_task(
 # -----------------------------------------------------
 
 
+PROJECT_ROW_TEMPLATE = """
+Project: {0} - {1}
+  Description: {2}
+  Status: {3}
+  Priority: {4}
+  Start Date: {5}
+  Due Date: {6}
+  Completed Date: {7}
+  Owner: {8}
+
+"""
+PROJECT_ECHO_BATCH = 64
+
+_LIST_PROJECTS_SQL = """
+    SELECT p.id, p.name, p.description, p.status, p.priority,
+           p.start_date, p.due_date, p.completed_date,
+           u.username as owner
+    FROM projects p
+    LEFT JOIN users u ON p.owner_id = u.id
+"""
+# One fixed query text per (status filter, owner filter) combination
+LIST_PROJECTS_QUERIES = {
+    (False, False): _LIST_PROJECTS_SQL,
+    (True, False): _LIST_PROJECTS_SQL + " WHERE p.status = %s",
+    (False, True): _LIST_PROJECTS_SQL + " WHERE p.owner_id = %s",
+    (True, True): _LIST_PROJECTS_SQL + " WHERE p.status = %s AND p.owner_id = %s",
+}
+
+
 @app.command()
+@with_conn()
 def list_projects(
     status: str = typer.Option(None, help="Filter by status (active, completed, etc)"),
     owner_id: int = typer.Option(None, help="Filter by owner ID"),
 ):
     """List all projects with optional filters."""
-    conn = get_db_connection()
-    cur = conn.cursor()
-
     try:
-        query = """
-            SELECT p.id, p.name, p.description, p.status, p.priority,
-                   p.start_date, p.due_date, p.completed_date,
-                   u.username as owner
-            FROM projects p
-            LEFT JOIN users u ON p.owner_id = u.id
-            WHERE 1=1
-        """
-        params = []
-
-        if status:
-            query += " AND p.status = %s"
-            params.append(status)
-
-        if owner_id:
-            query += " AND p.owner_id = %s"
-            params.append(owner_id)
-
-        cur.execute(query, params)
-        projects = cur.fetchall()
-
-        if not projects:
+        query = LIST_PROJECTS_QUERIES[bool(status), bool(owner_id)]
+        params = [value for value in (status, owner_id) if value]
+
+        # A named cursor streams rows in batches of itersize, so output starts
+        # with the first batch instead of after the whole table is fetched.
+        # Rows are rendered from one template and written PROJECT_ECHO_BATCH
+        # at a time.
+        found = False
+        render = PROJECT_ROW_TEMPLATE.format
+        with db_conn() as conn, conn.cursor(name="list_projects_cur") as cur:
+            cur.itersize = LIST_ITERSIZE
+            cur.execute(query, params)
+            for batch in itertools.batched(cur, PROJECT_ECHO_BATCH):
+                found = True
+                typer.echo("".join([render(*p) for p in batch]), nl=False)
+
+        if not found:
             typer.echo("No projects found.")
-            return
-
-        for project in projects:
-            typer.echo(
-                f"""
-Project: {project[0]} - {project[1]}
-  Description: {project[2]}
-  Status: {project[3]}
-  Priority: {project[4]}
-  Start Date: {project[5]}
-  Due Date: {project[6]}
-  Completed Date: {project[7]}
-  Owner: {project[8]}
-"""
-            )
     except Exception as e:
         typer.echo(f"❌ Failed to list projects: {str(e)}")
-    finally:
-        cur.close()
-        conn.close()
 
 
 @app.command()
+@with_conn()
 def assign_project(
     project_id: int = typer.Argument(..., help="Project ID to assign"),
     user_id: int = typer.Argument(..., help="User ID to assign as owner"),
 ):
     """Assign a project to a new owner."""
-    conn = get_db_connection()
-    cur = conn.cursor()
-
     try:
-        cur.execute(
-            """
-            UPDATE projects
-            SET owner_id = %s
-            WHERE id = %s
-        """,
-            (user_id, project_id),
-        )
+        with db_conn() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE projects
+                SET owner_id = %s
+                WHERE id = %s
+            """,
+                (user_id, project_id),
+            )
 
-        conn.commit()
+            conn.commit()
         typer.echo(f"✅ Project {project_id} assigned to user {user_id}")
     except Exception as e:
         typer.echo(f"❌ Failed to assign project: {str(e)}")
-    finally:
-        cur.close()
-        conn.close()
+
+
+ADD_TAG_SQL = """
+    WITH t AS (
+        INSERT INTO tags (name) SELECT DISTINCT unnest(%s::text[])
+        ON CONFLICT (name) DO UPDATE SET name = EXCLUDED.name
+        RETURNING id
+    )
+    INSERT INTO tag_associations (tag_id, item_id, item_type)
+    SELECT id, %s, %s FROM t
+    ON CONFLICT DO NOTHING
+"""
 
 
 @app.command()
+@with_conn()
 def add_tag(
-    name: str = typer.Argument(..., help="Tag name"),
+    names: List[str] = typer.Argument(..., help="Tag name(s)"),
     item_id: int = typer.Argument(..., help="ID of item to tag"),
     item_type: str = typer.Argument(..., help="Type of item (project/goal/task/event)"),
 ):
-    """Adds a tag to a project, goal, task, or event."""
-    conn = get_db_connection()
-    cur = conn.cursor()
-    now = datetime.now().isoformat()
-
-    # Create tag if it doesn't exist
-    cur.execute(
-        """
-    INSERT INTO tags (name, created_at) ON CONFLICT DO NOTHING RETURNING id; INSERT
-    VALUES (%s, %s)
-    """,
-        (name, now),
-    )
-
-    # Get tag ID
-    cur.execute("SELECT id FROM tags WHERE name = %s", (name,))
-    tag_id = cur.fetchone()[0]
-
-    # Create association
-    cur.execute(
-        """
-    INSERT INTO tag_associations (tag_id, item_id, item_type, created_at)
-    VALUES (%s, %s, %s, %s)
-    """,
-        (tag_id, item_id, item_type, now),
-    )
-
-    conn.commit()
-    conn.close()
-    return f"Tag '{name}' added to {item_type} {item_id}"
+    """Adds one or more tags to a project, goal, task, or event."""
+    with db_conn() as conn, conn.cursor() as cur:
+        # Upsert every tag and attach them all in one round-trip. DO UPDATE
+        # (rather than DO NOTHING) makes RETURNING yield ids of existing tags.
+        _prepared(cur, "add_tags", ADD_TAG_SQL, (names, item_id, item_type))
+        conn.commit()
+    return f"Tag(s) {', '.join(repr(n) for n in names)} added to {item_type} {item_id}"
 
 
 @app.command()
@@ -2056,6 +2377,9 @@ def awaken(
         if voice_type == "elevenlabs" and elevenlabs_voice:
             os.environ["ELEVEN_VOICE"] = elevenlabs_voice
 
+        from agents.conversation_agent import ConversationAgent, ConversationAgentConfig
+        from core.base_assistant import PlainAssistant
+
         # Initialize the base assistant
         assistant = PlainAssistant(logger, session_id)
 
@@ -2075,34 +2399,43 @@ def awaken(
         typer.echo("\nTry saying 'Hey Aiden, what can you do?' to get started")
         typer.echo("Press Ctrl+C to exit")
 
+        # One event loop for the whole session; asyncio.run would create and
+        # tear down a loop, and anything the agent opened on it, per utterance.
+        # Runner.close() also shuts down the executor used by to_thread.
+        runner = asyncio.Runner()
+
+        async def ask_agent(text: str):
+            # The agent gets a snapshot of the history plus this utterance, since
+            # process_text appends to the live list from its worker thread
+            history = [*assistant.conversation_history, {"role": "user", "content": text}]
+            agent_response = await conversation_agent.process({"text": text, "history": history})
+            return agent_response.data["response"] if agent_response.success else None
+
+        # The base assistant's reply is only a fallback for the agent's
+        responder = FallbackResponder(ask_agent, assistant.process_text, logger)
+
         def process_voice(text: str):
             try:
-                # Process through both assistants
-                base_response = assistant.process_text(text)
-                agent_response = asyncio.run(
-                    conversation_agent.process(
-                        {"text": text, "history": assistant.conversation_history}
-                    )
-                )
-
-                if agent_response.success:
-                    return agent_response.data["response"]
-                return base_response
+                return runner.run(responder.respond(text))
 
             except Exception as e:
                 logger.error(f"Error processing voice: {str(e)}")
                 return f"I encountered an error: {str(e)}"
 
-        while True:
-            try:
-                recorder.text(process_voice)
-            except interruption_with_keyboard:
-                typer.echo("\n👋 Shutting down voice interface...")
-                assistant.save_conversation()
-                break
-            except Exception as e:
-                typer.echo(f"Error in voice loop: {str(e)}")
-                continue
+        try:
+            while True:
+                try:
+                    get_recorder().text(process_voice)
+                except interruption_with_keyboard:
+                    typer.echo("\n👋 Shutting down voice interface...")
+                    runner.run(responder.finish())
+                    assistant.save_conversation()
+                    break
+                except Exception as e:
+                    typer.echo(f"Error in voice loop: {str(e)}")
+                    continue
+        finally:
+            runner.close()
 
     except Exception as e:
         typer.echo(f"❌ Error initializing voice interface: {str(e)}")
@@ -2141,64 +2474,11 @@ def run_director(
 
 
 @app.command()
-def create_director_config(
-    output_path: str = typer.Argument(
-        ..., help="Path to save the config file"
-    ),
-    prompt: str = typer.Option(
-        ..., help="Prompt or path to .md file with prompt"
-    ),
-    coder_model: str = typer.Option(
-        "gpt-4", help="Model to use for coding"
-    ),
-    evaluator_model: str = typer.Option(
-        "gpt-4o", help="Model to use for evaluation"
-    ),
-    max_iterations: int = typer.Option(
-        10, help="Maximum number of iterations (default: 10, use -1 for unlimited)"
-    ),
-    min_iterations: int = typer.Option(
-        3, help="Minimum number of iterations before accepting solution"
-    ),
-    execution_command: str = typer.Option(
-        "python {file}", help="Command to execute generated code"
-    ),
-    editable_files: List[str] = typer.Option(
-        [], help="List of files that can be edited"
-    ),
-    readonly_files: List[str] = typer.Option(
-        [], help="List of files that are read-only context"
-    ),
-):
-    """Create a new director configuration file."""
-    try:
-        config = {
-            "prompt": prompt,
-            "coder_model": coder_model,
-            "evaluator_model": evaluator_model,
-            "max_iterations": max_iterations,
-            "min_iterations": min_iterations,
-            "execution_command": execution_command,
-            "context_editable": editable_files,
-            "context_read_only": readonly_files,
-            "evaluator": "default",
-        }
-
-        with open(output_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False)
-
-        typer.echo(f"✅ Created director config at {output_path}")
-
-    except Exception as e:
-        typer.echo(f"❌ Failed to create config: {str(e)}")
-
-
-@app.command()
-def generate_spec(
-    name: str = typer.Argument(..., help="Name of the feature specification"),
-    template: str = typer.Option("feature.yml", help="Template to use"),
-    patterns: List[str] = typer.Option([], help="List of patterns to include"),
-    output_dir: str = typer.Option("specs", help="Directory to save the spec file"),
+def generate_spec(
+    name: str = typer.Argument(..., help="Name of the feature specification"),
+    template: str = typer.Option("feature.yml", help="Template to use"),
+    patterns: List[str] = typer.Option([], help="List of patterns to include"),
+    output_dir: str = typer.Option("specs", help="Directory to save the spec file"),
 ):
     """Generate a new feature specification from a template."""
     try:
@@ -2219,34 +2499,29 @@ def generate_spec(
         typer.echo(f"❌ Failed to generate spec: {str(e)}")
 
 
-@app.command()
-def list_spec_templates():
-    """List available specification templates."""
-    try:
-        generator = SpecPromptGenerator()
+@functools.lru_cache(maxsize=8)
+def _scan_spec_templates(dir_str: str, dir_mtime_ns: int) -> List[Path]:
+    """Glob a template directory; cached until the directory changes"""
+    return sorted(Path(dir_str).glob("*.yml"))
 
-        template_dir = generator.template_dir / "spec_templates"
-        templates = list(template_dir.glob("*.yml"))
 
-        if not templates:
-            typer.echo("No templates found")
-            return
+def _list_spec_templates(template_dir: Path) -> List[Path]:
+    """Return the spec templates in template_dir, or [] if it doesn't exist"""
+    try:
+        mtime_ns = template_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    return _scan_spec_templates(str(template_dir), mtime_ns)
 
-        typer.echo("📄 Available templates:")
-        for template in templates:
-            typer.echo(f"  - {template.name}")
 
-            # Show template description if available
-            try:
-                with open(template) as f:
-                    spec = yaml.safe_load(f)
-                    if "description" in spec:
-                        typer.echo(f"    {spec['description']}")
-            except:
-                pass
+def _spec_template_description(path: Path) -> Optional[str]:
+    """Return a spec template's description, or None if it can't be read"""
+    from core.project_generator import load_spec_template
 
-    except Exception as e:
-        typer.echo(f"❌ Failed to list templates: {str(e)}")
+    try:
+        return (load_spec_template(path) or {}).get("description")
+    except Exception:
+        return None
 
 
 # -----------------------------------------------------
@@ -2262,7 +2537,11 @@ def start(
     """Start aiden in either CLI or voice mode"""
     try:
         # Set up logging
-        setup_logging(str | None)
+        setup_logging(debug=debug)
+
+        # Keep SQLite query plans fresh for as long as the session runs
+        if os.getenv("SUPABASE_DATABASE_URL"):
+            schedule_sqlite_optimize(get_db_engine())
 
         if mode == "voice":
             typer.echo("Starting voice mode...")
@@ -2276,36 +2555,101 @@ def start(
         raise typer.Exit(1)
 
 
+# Written by initialize when it sets up a new git repository
+_GITIGNORE = b"""\
+# Python
+__pycache__/
+*.py[cod]
+*$py.class
+*.so
+.Python
+build/
+develop-eggs/
+dist/
+downloads/
+eggs/
+.eggs/
+lib/
+lib64/
+parts/
+sdist/
+var/
+wheels/
+*.egg-info/
+.installed.cfg
+*.egg
+
+# Virtual Environment
+.env
+.venv
+env/
+venv/
+ENV/
+
+# Aiden
+.aiden*
+"""
+
+
+# Git helpers: use libgit2 in-process when pygit2 is installed, otherwise
+# fall back to the git CLI
+def _git_discover(path: Path) -> Optional[str]:
+    """Return the git directory containing path, or None outside a repo"""
+    if pygit2 is not None:
+        return pygit2.discover_repository(str(path))
+    result = subprocess.run(
+        ["git", "rev-parse", "--git-dir"], cwd=path, capture_output=True, text=True
+    )
+    return str(path / result.stdout.strip()) if result.returncode == 0 else None
+
+
+def _git_remote_url(repo_dir: str, name: str = "origin") -> Optional[str]:
+    """Return the URL of remote `name`, or None if it isn't configured"""
+    if pygit2 is not None:
+        try:
+            return pygit2.Repository(repo_dir).remotes[name].url
+        except KeyError:
+            return None
+    result = subprocess.run(
+        ["git", "--git-dir", repo_dir, "remote", "get-url", name],
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _git_init(path: Path) -> None:
+    if pygit2 is not None:
+        pygit2.init_repository(str(path))
+    else:
+        subprocess.run(["git", "init"], cwd=path, check=True)
+
+
 @app.command()
-def initialize(project_dir=setup_project_dir(Path.cwd())):
+def initialize(
+    project_dir: Optional[Path] = typer.Option(
+        None, help="Project directory to scaffold (defaults to the current directory)"
+    ),
+):
     """First-time setup for Aiden in a directory."""
     try:
         cwd = Path.cwd()
+        # Resolved here rather than as the default, which Typer would
+        # evaluate (creating directories) at import for every command
+        project_dir = project_dir or setup_project_dir(cwd)
 
         # Check if we're in a git repo
-        is_git_repo = False
-        try:
-            subprocess.run(
-                ["git", "rev-parse", "--git-dir"], check=True, capture_output=True
-            )
-            is_git_repo = True
-        except subprocess.CalledProcessError:
-            pass
+        repo_dir = _git_discover(cwd)
 
-        if is_git_repo:
+        if repo_dir:
             # Existing project flow
             typer.echo("📂 Found existing git repository")
 
             # Check if repo has remote
-            try:
-                remote = subprocess.run(
-                    ["git", "remote", "get-url", "origin"],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-                typer.echo(f"🔗 Repository is linked to: {remote.stdout.strip()}")
-            except subprocess.CalledProcessError:
+            remote_url = _git_remote_url(repo_dir)
+            if remote_url:
+                typer.echo(f"🔗 Repository is linked to: {remote_url}")
+            else:
                 if typer.confirm(
                     "❓ Repository isn't pushed to a remote. Would you like to set up GitHub?"
                 ):
@@ -2328,44 +2672,9 @@ def initialize(project_dir=setup_project_dir(Path.cwd())):
                 os.chdir(project_dir)
 
             if typer.confirm("❓ Would you like to initialize git?"):
-                subprocess.run(["git", "init"], check=True)
+                _git_init(Path.cwd())
 
-                # Create .gitignore
-                gitignore_content = """
-# Python
-__pycache__/
-*.py[cod]
-*$py.class
-*.so
-.Python
-build/
-develop-eggs/
-dist/
-downloads/
-eggs/
-.eggs/
-lib/
-lib64/
-parts/
-sdist/
-var/
-wheels/
-*.egg-info/
-.installed.cfg
-*.egg
-
-# Virtual Environment
-.env
-.venv
-env/
-venv/
-ENV/
-
-# Aiden
-.aiden*
-"""
-                with open(".gitignore", "w") as f:
-                    f.write(gitignore_content.strip())
+                Path(".gitignore").write_bytes(_GITIGNORE)
 
                 if typer.confirm("❓ Would you like to create a GitHub repository?"):
                     private = typer.confirm("❓ Should the repository be private?")
@@ -2389,7 +2698,7 @@ ENV/
                 },
             }
             with open(".aiden.conf.yml", "w") as f:
-                yaml.dump(config, f, default_flow_style=False)
+                yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
             typer.echo("✅ Created Aiden configuration")
 
         typer.echo(
@@ -2409,30 +2718,21 @@ def set_project_description(
     description: str = typer.Argument(..., help="New project description"),
 ) -> None:
     """Set the description for a project"""
+    db = get_db_session()
     try:
-        project = Project.get_by_name(project_name)
+        project = Project.get_by_name(db, project_name)
+        if project is None:
+            typer.echo(f"❌ Project '{project_name}' not found", err=True)
+            return
         project.description = description
-        project.save()
+        db.commit()
         typer.echo(f"✅ Updated description for project {project_name}")
     except Exception as e:
+        db.rollback()
         typer.echo(f"❌ Error: {str(e)}", err=True)
         raise typer.Exit(1)
-
-
-@app.command()
-def list_projects() -> None:
-    """List all projects"""
-    try:
-        projects = Project.get_all()
-        if not projects:
-            typer.echo("No projects found")
-            return
-
-        for project in projects:
-            typer.echo(f"📁 {project.name}: {project.description}")
-    except Exception as e:
-        typer.echo(f"❌ Error: {str(e)}", err=True)
-        raise typer.Exit(1)
+    finally:
+        db.close()
 
 
 @app.command()
@@ -2442,8 +2742,12 @@ def show_project(
     )
 ) -> None:
     """Show detailed information about a project"""
+    db = get_db_session()
     try:
-        project = Project.get_by_name(project_name)
+        project = Project.get_by_name(db, project_name)
+        if project is None:
+            typer.echo(f"❌ Project '{project_name}' not found", err=True)
+            return
         typer.echo(
             f"""
 Project Details:
@@ -2456,6 +2760,8 @@ Project Details:
     except Exception as e:
         typer.echo(f"❌ Error: {str(e)}", err=True)
         raise typer.Exit(1)
+    finally:
+        db.close()
 
 
 # Task Management Commands
@@ -2466,13 +2772,21 @@ def add_task(
     priority: int = typer.Option(3, help="Task priority (1-5)", min=1, max=5),
 ) -> None:
     """Add a new task to a project"""
+    db = get_db_session()
     try:
-        project = Project.get_by_name(project_name)
-        task = project.add_task(name=name, priority=priority)
+        project = Project.get_by_name(db, project_name)
+        if project is None:
+            typer.echo(f"❌ Project '{project_name}' not found", err=True)
+            return
+        project.tasks.append(Task(task_name=name, priority=priority))
+        db.commit()
         typer.echo(f"✅ Added task '{name}' to project {project_name}")
     except Exception as e:
+        db.rollback()
         typer.echo(f"❌ Error: {str(e)}", err=True)
         raise typer.Exit(1)
+    finally:
+        db.close()
 
 
 @app.command()
@@ -2481,14 +2795,21 @@ def set_task_priority(
     priority: int = typer.Argument(..., help="New priority (1-5)", min=1, max=5),
 ) -> None:
     """Update the priority of a task"""
+    db = get_db_session()
     try:
-        task = Task.get_by_name(task_name)
+        task = Task.get_by_name(db, task_name)
+        if task is None:
+            typer.echo(f"❌ Task '{task_name}' not found", err=True)
+            return
         task.priority = priority
-        task.save()
+        db.commit()
         typer.echo(f"✅ Updated priority for task '{task_name}' to {priority}")
     except Exception as e:
+        db.rollback()
         typer.echo(f"❌ Error: {str(e)}", err=True)
         raise typer.Exit(1)
+    finally:
+        db.close()
 
 
 @app.command()
@@ -2496,29 +2817,24 @@ def complete_task(
     task_name: str = typer.Argument(..., help="Name of the task to mark as complete")
 ) -> None:
     """Mark a task as complete"""
+    db = get_db_session()
     try:
-        task = Task.get_by_name(task_name)
-        task.complete()
+        task = Task.get_by_name(db, task_name)
+        if task is None:
+            typer.echo(f"❌ Task '{task_name}' not found", err=True)
+            return
+        task.status = "complete"
+        db.commit()
         typer.echo(f"✅ Marked task '{task_name}' as complete")
     except Exception as e:
+        db.rollback()
         typer.echo(f"❌ Error: {str(e)}", err=True)
         raise typer.Exit(1)
+    finally:
+        db.close()
 
 
 # Database Commands
-@app.command()
-def init_db() -> None:
-    """Initialize the database"""
-    try:
-        from models.base import init_database
-
-        init_database()
-        typer.echo("✅ Database initialized successfully")
-    except Exception as e:
-        typer.echo(f"❌ Error: {str(e)}", err=True)
-        raise typer.Exit(1)
-
-
 @app.command()
 def backup_db(
     output_dir: str = typer.Option("./backups", help="Directory to store backup")
@@ -2554,6 +2870,8 @@ def backup_db(
 @app.command()
 def validate_db() -> None:
     """Validate database connection and schema"""
+    import psycopg2
+
     try:
         # Get database connection details from config
         config = get_config()
@@ -2563,15 +2881,15 @@ def validate_db() -> None:
         conn = psycopg2.connect(**db_params)
         cur = conn.cursor()
 
-        # Check if required tables exist
+        # Check all required tables exist in a single query
         tables = ["projects", "tasks", "users"]
-        for table in tables:
-            cur.execute(
-                f"SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = '{table}')"
-            )
-            exists = cur.fetchone()[0]
-            if not exists:
-                raise Exception(f"Required table '{table}' not found")
+        cur.execute(
+            "SELECT table_name FROM information_schema.tables WHERE table_name = ANY(%s)",
+            (tables,),
+        )
+        missing = set(tables) - {row[0] for row in cur.fetchall()}
+        if missing:
+            raise Exception(f"Required table(s) not found: {', '.join(sorted(missing))}")
 
         conn.close()
         typer.echo("✅ Database validation successful")
@@ -2657,27 +2975,6 @@ def create_client(
     pass
 
 
-@app.command()
-def calendar_events(
-    action: str = typer.Argument(
-        ..., help="Action to perform: list, create, update, delete"
-    ),
-    event_id: Optional[int] = typer.Option(
-        None, help="Event ID for update/delete operations"
-    ),
-    title: Optional[str] = typer.Option(None, help="Event title"),
-    start_time: Optional[str] = typer.Option(
-        None, help="Start time (YYYY-MM-DD HH:MM)"
-    ),
-    end_time: Optional[str] = typer.Option(None, help="End time (YYYY-MM-DD HH:MM)"),
-    description: Optional[str] = typer.Option(None, help="Event description"),
-    location: Optional[str] = typer.Option(None, help="Event location"),
-    attendees: Optional[List[str]] = typer.Option(None, help="List of attendee emails"),
-):
-    """Manage calendar events"""
-    pass
-
-
 @app.command()
 def task_dependencies(
     action: str = typer.Argument(..., help="Action to perform: list, add, remove"),
@@ -2702,24 +2999,6 @@ def tag_associations(
     pass
 
 
-@app.command()
-def tags(
-    action: str = typer.Argument(
-        ..., help="Action to perform: list, create, update, delete"
-    ),
-    tag_id: Optional[int] = typer.Option(
-        None, help="Tag ID for update/delete operations"
-    ),
-    name: Optional[str] = typer.Option
-        (None, help="Tag name"),
-    color: Optional[str] = typer.Option
-        (None, help="Tag color (hex code)"),
-    description: Optional[str] = typer.Option
-        (None, help="Tag description"),
-):
-    """Manage tags in the system"""
-    pass
-
 @app.command()
 def add(
     item_type: str = typer.Argument(
@@ -2734,6 +3013,7 @@ def add(
 ):
     """Add a new item using templates"""
     try:
+        template_manager = get_template_manager()
         if list_templates:
             template_manager.list_templates(item_type)
             return
@@ -2792,106 +3072,6 @@ def tags(
     """Manage tags in the system"""
     pass
 
-@app.command()
-def awaken(
-    model: str = typer.Option(
-        "gpt-4",
-        "--model",
-        "-m",
-        help=(
-            "Model to use: gpt-4, gpt-3.5-turbo, "
-            "claude-3-opus, claude-3-sonnet"
-        )
-    ),
-    voice_type: str = typer.Option(
-        "elevenlabs",
-        "--voice-type",
-        "-v",
-        help="Voice type to use: local, realtime-tts, or elevenlabs"
-    ),
-    elevenlabs_voice: str = typer.Option(
-        None, "--elevenlabs-voice", help="ElevenLabs voice ID (only for elevenlabs voice type)"
-    ),
-    brain: str = typer.Option(
-        "ollama:dolphin-mixtral",
-        "--brain",
-        "-b",
-        help="Brain to use: ollama:<model> or deepseek"
-    ),
-    system_prompt: str = typer.Option(
-        None, "--system-prompt", "-s", help="System prompt for the conversation agent"
-    ),
-    conversation_style: str = typer.Option(
-        "casual",
-        "--style",
-        help="Conversation style: casual, professional, or technical"
-    ),
-    interruption_with_keyboard=None
-):
-    """Start an enhanced voice interface with advanced conversation capabilities"""
-    try:
-        # Initialize logging
-        session_id = create_session_logger_id()
-        logger = setup_logging(session_id)
-        logger.info(f"🚀 Starting enhanced voice session {session_id}")
-
-        # Set up voice configuration
-        if voice_type == "elevenlabs" and elevenlabs_voice:
-            os.environ["ELEVEN_VOICE"] = elevenlabs_voice
-
-        # Initialize the base assistant
-        assistant = PlainAssistant(logger, session_id)
-
-        # Configure the conversation agent
-        agent_config = ConversationAgentConfig(
-            model_name=model,
-            system_prompt=system_prompt or "You are a helpful AI assistant.",
-            conversation_style=conversation_style,
-            max_history=10,
-        )
-        conversation_agent = ConversationAgent(agent_config)
-        
-        typer.echo(f"🎤 Voice interface activated with:")
-        typer.echo(f"   - Model: {model}")
-        typer.echo(f"   - Voice: {voice_type}")
-        typer.echo(f"   - Brain: {brain}")
-        typer.echo("\nTry saying 'Hey Aiden, what can you do?' to get started")
-        typer.echo("Press Ctrl+C to exit")
-
-        def process_voice(text: str):
-            try:
-                # Process through both assistants
-                base_response = assistant.process_text(text)
-                agent_response = asyncio.run(
-                    conversation_agent.process(
-                        {"text": text, "history": assistant.conversation_history}
-                    )
-                )
-
-                if agent_response.success:
-                    return agent_response.data["response"]
-                return base_response
-
-            except Exception as e:
-                logger.error(f"Error processing voice: {str(e)}")
-                return f"I encountered an error: {str(e)}"
-
-        while True:
-            try:
-                recorder.text(process_voice)
-            except interruption_with_keyboard:
-                typer.echo("\n👋 Shutting down voice interface...")
-                assistant.save_conversation()
-                break
-            except Exception as e:
-                typer.echo(f"Error in voice loop: {str(e)}")
-                continue
-
-    except Exception as e:
-        typer.echo(f"❌ Error initializing voice interface: {str(e)}")
-        raise typer.Exit(1)
-
-
 @app.command()
 def create_director_config(
     output_path: str = typer.Argument(
@@ -2933,50 +3113,24 @@ def create_director_config(
         }
 
         with open(output_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False)
+            yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
 
         typer.echo(f"✅ Created director config at {output_path}")
 
     except Exception as e:
         typer.echo(f"❌ Failed to create config: {str(e)}")
 
-@app.command()
-def list_spec_templates():
-    """List available specification templates."""
-    try:
-        generator = SpecPromptGenerator()
-
-        template_dir = generator.template_dir / "spec_templates"
-        templates = list(template_dir.glob("*.yml"))
-
-        if not templates:
-            typer.echo("No templates found")
-            return
-
-        typer.echo("📄 Available templates:")
-        for template in templates:
-            typer.echo(f"  - {template.name}")
-
-            # Show template description if available
-            try:
-                with open(template) as f:
-                    spec = yaml.safe_load(f)
-                    if "description" in spec:
-                        typer.echo(f"    {spec['description']}")
-            except:
-                pass
-
-    except Exception as e:
-        typer.echo(f"❌ Failed to list templates: {str(e)}")
 
 @app.command()
 def list_spec_templates():
     """List available specification templates."""
     try:
+        from core.project_generator import SpecPromptGenerator
+
         generator = SpecPromptGenerator()
 
         template_dir = generator.template_dir / "spec_templates"
-        templates = list(template_dir.glob("*.yml"))
+        templates = _list_spec_templates(template_dir)
 
         if not templates:
             typer.echo("No templates found")
@@ -2987,13 +3141,9 @@ def list_spec_templates():
             typer.echo(f"  - {template.name}")
 
             # Show template description if available
-            try:
-                with open(template) as f:
-                    spec = yaml.safe_load(f)
-                    if "description" in spec:
-                        typer.echo(f"    {spec['description']}")
-            except:
-                pass
+            description = _spec_template_description(template)
+            if description:
+                typer.echo(f"    {description}")
 
     except FileNotFoundError as e:
         typer.echo(f"Template directory not found: {str(e)}")
@@ -3003,124 +3153,79 @@ def list_spec_templates():
         typer.echo(f"Unexpected error listing templates: {str(e)}")
         typer.echo(f"Error in list_spec_templates: {str(e)}")
 
-@app.command()
-def validate_db():
-    """Validate database connection and schema"""
-    try:
-        # Validation code here
-        pass
-    except psycopg2.Error as e:
-        typer.echo(f"Database error: {str(e)}")
-    except Exception as e:
-        typer.echo(f"Unexpected error during validation: {str(e)}")
+EVENT_ROW_TEMPLATE = """
+Event: {0}
+  Start: {1}
+  End: {2}
+  Location: {3}
+  Description: {4}
 
-@app.command()
-def list_projects(
-    status: str = typer.Option(
-        None,
-        help="Filter by status (active, completed, etc)"
-    ),
-    owner_id: int = typer.Option(
-        None,
-        help="Filter by owner ID"
-    ),
-):
-    """List all projects with optional filters."""
-    try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-
-        # Build query based on filters
-        query = """
-            SELECT 
-                p.id,
-                p.name,
-                p.description,
-                p.status,
-                p.priority,
-                p.start_date,
-                p.due_date,
-                p.completed_date,
-                u.username as owner
-            FROM projects p
-            LEFT JOIN users u ON p.owner_id = u.id
-            WHERE 1=1
-        """
-        params = []
-
-        if status:
-            query += " AND p.status = ?"
-            params.append(status)
-
-        if owner_id:
-            query += " AND p.owner_id = ?"
-            params.append(owner_id)
-
-        cur.execute(query, params)
-        projects = cur.fetchall()
-
-        if not projects:
-            typer.echo("No projects found matching criteria")
-            return
-
-        for project in projects:
-            typer.echo(
-                f"""
-Project: {project[0]} - {project[1]}
-  Description: {project[2]}
-  Status: {project[3]}
-  Priority: {project[4]}
-  Start Date: {project[5]}
-  Due Date: {project[6]}
-  Completed Date: {project[7]}
-  Owner: {project[8]}
 """
-            )
-    except Exception as e:
-        typer.echo(f"❌ Failed to list projects: {str(e)}")
-    finally:
-        conn.close()
-
 
 def list_calendar_events():
-    """List all calendar events"""
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM calendar_events ORDER BY start_time")
-    return cur.fetchall()
+    """List all calendar events as (title, start_time, end_time, location, description) rows"""
+    with db_conn(readonly=True) as conn, conn.cursor() as cur:
+        cur.execute(
+            "SELECT title, start_time, end_time, location, description"
+            " FROM calendar_events ORDER BY start_time"
+        )
+        return cur.fetchall()
+
+def create_calendar_events(rows: List[tuple]) -> List[int]:
+    """Create many calendar events from (title, start_time, end_time, description, location) rows"""
+    from psycopg2.extras import execute_values
+
+    with db_conn() as conn, conn.cursor() as cur:
+        # One multi-row INSERT per page instead of a statement per event
+        event_ids = execute_values(
+            cur,
+            "INSERT INTO calendar_events (title, start_time, end_time, description, location)"
+            " VALUES %s RETURNING id",
+            rows,
+            page_size=1000,
+            fetch=True,
+        )
+        conn.commit()
+    return [event_id for (event_id,) in event_ids]
 
 def create_calendar_event(title: str, start_time: str, end_time: Optional[str] = None,
                          description: str = "", location: str = "", 
                          attendees: Optional[List[str]] = None):
     """Create a new calendar event"""
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute("""
-        INSERT INTO calendar_events (title, start_time, end_time, description, location)
-        VALUES (%s, %s, %s, %s, %s)
-        RETURNING id
-    """, (title, start_time, end_time, description, location))
-    event_id = cur.fetchone()[0]
-    conn.commit()
-    return event_id
+    return create_calendar_events([(title, start_time, end_time, description, location)])[0]
 
-def update_calendar_event(event_id: int, title: str, start_time: str):
-    """Update an existing calendar event"""
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute("""
-        UPDATE calendar_events 
-        SET title = %s, start_time = %s
-        WHERE id = %s
-    """, (title, start_time, event_id))
-    conn.commit()
+CALENDAR_EVENT_COLUMNS = frozenset({"title", "start_time", "end_time", "description", "location"})
+
+def update_calendar_event(event_id: int, **fields):
+    """Update only the given columns of an existing calendar event"""
+    from psycopg2 import sql
+
+    unknown = fields.keys() - CALENDAR_EVENT_COLUMNS
+    if unknown:
+        raise ValueError(f"Unknown calendar event fields: {', '.join(sorted(unknown))}")
+    if not fields:
+        return
+
+    # Sorted so each set of columns always produces the same statement text
+    columns = sorted(fields)
+    query = sql.SQL("UPDATE calendar_events SET {} WHERE id = %s").format(
+        sql.SQL(", ").join(
+            sql.SQL("{} = %s").format(sql.Identifier(column)) for column in columns
+        )
+    )
+    with db_conn() as conn, conn.cursor() as cur:
+        cur.execute(query, [fields[column] for column in columns] + [event_id])
+        conn.commit()
+
+def delete_calendar_events(event_ids: List[int]):
+    """Delete several calendar events in one statement"""
+    with db_conn() as conn, conn.cursor() as cur:
+        cur.execute("DELETE FROM calendar_events WHERE id = ANY(%s)", (list(event_ids),))
+        conn.commit()
 
 def delete_calendar_event(event_id: int):
     """Delete a calendar event"""
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM calendar_events WHERE id = %s", (event_id,))
-    conn.commit()
+    delete_calendar_events([event_id])
 
 
 @app.command()
@@ -3128,8 +3233,8 @@ def calendar_events(
     action: str = typer.Argument(
         ..., help="Action to perform: list, create, update, delete"
     ),
-    event_id: Optional[int] = typer.Option(
-        None, help="Event ID for update/delete operations"
+    event_ids: Optional[List[int]] = typer.Option(
+        None, "--event-id", help="Event ID for update/delete (repeat to delete several)"
     ),
     title: Optional[str] = typer.Option(None, help="Event title"),
     start_time: Optional[str] = typer.Option(
@@ -3139,21 +3244,34 @@ def calendar_events(
     description: Optional[str] = typer.Option(None, help="Event description"),
     location: Optional[str] = typer.Option(None, help="Event location"),
     attendees: Optional[List[str]] = typer.Option(None, help="List of attendee emails"),
+    csv_path: Optional[str] = typer.Option(
+        None,
+        "--csv",
+        help="Create events from a CSV with title, start_time, end_time, description, location columns",
+    ),
 ):
     """Manage calendar events"""
     try:
         if action == "list":
             events = list_calendar_events()
-            for event in events:
-                typer.echo(
-                    f"""
-Event: {event.title}
-  Start: {event.start_time}
-  End: {event.end_time}
-  Location: {event.location}
-  Description: {event.description}
-"""
-                )
+            # Render every event up front and write them with a single echo
+            typer.echo("".join(EVENT_ROW_TEMPLATE.format(*event) for event in events), nl=False)
+        elif action == "create" and csv_path:
+            import csv
+
+            with open(csv_path, newline="") as f:
+                rows = [
+                    (
+                        row["title"],
+                        row["start_time"],
+                        row.get("end_time") or None,
+                        row.get("description") or "",
+                        row.get("location") or "",
+                    )
+                    for row in csv.DictReader(f)
+                ]
+            event_ids = create_calendar_events(rows)
+            typer.echo(f"✅ Created {len(event_ids)} events")
         elif action == "create":
             if not all([title, start_time]):
                 typer.echo(
@@ -3169,12 +3287,26 @@ Event: {event.title}
                 attendees=attendees
             )
         elif action in ["update", "delete"]:
-            if not event_id:
+            if not event_ids:
                 typer.echo("Event ID is required for update/delete")
                 return
             if action == "update":
-                update_calendar_event(event_id, title, start_time)
+                if len(event_ids) != 1:
+                    typer.echo("Update takes exactly one event ID")
+                    return
+                fields = {
+                    "title": title,
+                    "start_time": start_time,
+                    "end_time": end_time,
+                    "description": description,
+                    "location": location,
+                }
+                changed = {k: v for k, v in fields.items() if v is not None}
+                if not changed:
+                    typer.echo("Nothing to update")
+                    return
+                update_calendar_event(event_ids[0], **changed)
             else:
-                delete_calendar_event(event_id)
+                delete_calendar_events(event_ids)
     except Exception as e:
         typer.echo(f"Error managing calendar events: {str(e)}")
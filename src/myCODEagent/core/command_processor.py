@@ -5,6 +5,8 @@ import time
 import yaml
 import re
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 @dataclass
 class VoiceParameter:
     name: str
@@ -39,7 +41,7 @@ class VoiceCommandProcessor:
             raise FileNotFoundError("Voice commands template not found")
 
         with command_file.open() as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
             for cmd in data.get("voice_commands", []):
                 params = [VoiceParameter(**p) for p in cmd["parameters"]]
                 command = VoiceCommand(
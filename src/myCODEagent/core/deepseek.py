@@ -1,7 +1,7 @@
-import json
 import os
 from typing import Dict, List
 
+import orjson
 from dotenv import load_dotenv
 from openai import OpenAI
 
@@ -59,7 +59,7 @@ def json_prompt(prompt: str, model: str = DEEPSEEK_V3_MODEL) -> dict:
     response = client.chat.completions.create(
         model=model, messages=messages, response_format={"type": "json_object"}
     )
-    return json.loads(response.choices[0].message.content)
+    return orjson.loads(response.choices[0].message.content)
 
 
 def prefix_prompt(
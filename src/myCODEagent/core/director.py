@@ -12,6 +12,8 @@ from aiden.coders import Coder
 from aiden.models import Model
 from aiden.io import InputOutput
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class AgentResponse(BaseModel):
     success: bool
@@ -52,7 +54,7 @@ class Director:
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
         with open(config_path) as f:
-            config_dict = yaml.safe_load(f)
+            config_dict = yaml.load(f, Loader=_YamlLoader)
 
         # If prompt ends with .md, read content from that file
         if config_dict["prompt"].endswith(".md"):
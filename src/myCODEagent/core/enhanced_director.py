@@ -5,6 +5,8 @@ import yaml
 
 from core.director import Director
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class EnhancedDirector(Director):
     def __init__(self, config_path: str):
@@ -16,7 +18,7 @@ class EnhancedDirector(Director):
         context_path = Path("aiden_context.yml")
         if context_path.exists():
             with open(context_path) as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=_YamlLoader)
         return {}
 
     def create_new_ai_coding_prompt(self, *args, **kwargs):
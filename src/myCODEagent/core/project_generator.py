@@ -1,9 +1,63 @@
+import functools
+import os
 import shutil
+import tempfile
 from pathlib import Path
-from typing import List
+from types import MappingProxyType
+from typing import Any, List
 
+import orjson
 import yaml
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_spec_template(path: Path) -> Any:
+    """Parse a YAML template once per process and file version.
+
+    The result is shared between callers, so it is returned read-only:
+    mappings as MappingProxyType and lists as tuples.
+    """
+    return _parse_spec_template(str(path), path.stat().st_mtime_ns)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in MappingProxyType and turn lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_spec_template(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML template, via a sibling JSON cache that is rebuilt when the YAML changes"""
+    path = Path(path)
+    cache = path.with_suffix(path.suffix + ".cache.json")
+    try:
+        if cache.stat().st_mtime_ns >= mtime_ns:
+            return _freeze(orjson.loads(cache.read_bytes()))
+    except (OSError, orjson.JSONDecodeError):
+        pass
+
+    data = yaml.load(path.read_bytes(), Loader=_YamlLoader)
+    try:
+        # Dates and other non-JSON scalars would not round-trip, so such
+        # templates are simply left uncached
+        payload = orjson.dumps(data, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, cache)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except (OSError, TypeError):
+        pass
+    return _freeze(data)
+
 
 class SpecPromptGenerator:
     def __init__(self):
@@ -57,8 +111,7 @@ class SpecPromptGenerator:
         spec_path.parent.mkdir(exist_ok=True)
 
         # Load and customize template
-        with open(template_path) as f:
-            spec = yaml.safe_load(f)
+        spec = dict(load_spec_template(template_path))
 
         # Add patterns if specified
         if patterns:
@@ -1,33 +1,63 @@
-import json
-from typing import Dict, List
+import functools
+from typing import Dict, Iterator, List
 
 import ollama
+import orjson
 
 R1_MODEL = "r1"
+# How long the server keeps the model (and its prompt cache) loaded between calls
+KEEP_ALIVE = "30m"
+
+# One client for the process, so every call reuses the same HTTP connection
+_client = ollama.Client()
+
+
+def stream_chat(model: str, messages: List[Dict[str, str]]) -> Iterator[str]:
+    """Yield a chat completion's reply text piece by piece as the server produces it"""
+    for part in _client.chat(model=model, messages=messages, keep_alive=KEEP_ALIVE, stream=True):
+        yield part.message.content
+
+
+def _chat(model: str, messages: List[Dict[str, str]]) -> str:
+    """Run a chat completion and return the reply text"""
+    return "".join(stream_chat(model, messages))
+
+
+def _generate(model: str, prompt: str, **kwargs) -> str:
+    """Run a plain completion and return the generated text"""
+    return _client.generate(model=model, prompt=prompt, keep_alive=KEEP_ALIVE, **kwargs).response
+
+
+@functools.lru_cache(maxsize=32)
+def _supports_insert(model: str) -> bool:
+    """Whether the server has a fill-in-the-middle template for the model"""
+    try:
+        return "insert" in (_client.show(model).capabilities or ())
+    except ollama.ResponseError:
+        return False
 
 
 def prompt(prompt: str, model: str = R1_MODEL) -> str:
     """
     Send a prompt to R1 and get detailed response.
     """
-    response = ollama.chat(
-        model=model,
-        messages=[{"role": "user", "content": prompt}]
-    )
-    return response.message.content
+    return _chat(model, [{"role": "user", "content": prompt}])
 
 
 def fill_in_the_middle_prompt(prompt: str, suffix: str, model: str = R1_MODEL) -> str:
     """
     Send a fill-in-the-middle prompt to R1 and get response.
     """
-    # Format the FIM prompt for R1
+    # When the model has a FIM template the server applies it to prompt and
+    # suffix, so no tokens are spent restating the task
+    if _supports_insert(model):
+        try:
+            return prompt + _generate(model, prompt, suffix=suffix) + suffix
+        except ollama.ResponseError:
+            pass
     fim_prompt = f"{prompt}\n[Your task is to complete the code between the prefix and suffix]\n{suffix}"
-    response = ollama.chat(
-        model=model,
-        messages=[{"role": "user", "content": fim_prompt}]
-    )
-    return prompt + response.message.content + suffix
+    content = _chat(model, [{"role": "user", "content": fim_prompt}])
+    return prompt + content + suffix
 
 
 def json_prompt(prompt: str, model: str = R1_MODEL) -> dict:
@@ -43,11 +73,7 @@ def json_prompt(prompt: str, model: str = R1_MODEL) -> dict:
     """
     # Add JSON formatting instruction
     json_prompt = f"{prompt}\n[Please respond with valid JSON only]"
-    response = ollama.chat(
-        model=model,
-        messages=[{"role": "user", "content": json_prompt}]
-    )
-    return json.loads(response.message.content)
+    return orjson.loads(_chat(model, [{"role": "user", "content": json_prompt}]))
 
 
 def prefix_prompt(prompt: str, prefix: str, model: str = R1_MODEL, no_prefix: bool = False) -> str:
@@ -64,11 +90,7 @@ def prefix_prompt(prompt: str, prefix: str, model: str = R1_MODEL, no_prefix: bo
     """
     # Format the prefix prompt
     prefix_prompt = f"{prompt}\n[Your response must start with: {prefix}]"
-    response = ollama.chat(
-        model=model,
-        messages=[{"role": "user", "content": prefix_prompt}]
-    )
-    content = response.message.content
+    content = _chat(model, [{"role": "user", "content": prefix_prompt}])
     return content if no_prefix else prefix + content
 
 
@@ -85,13 +107,15 @@ def prefix_then_stop_prompt(prompt: str, prefix: str, suffix: str, model: str =
     Returns:
         str: The model's response constrained by the prefix and suffix
     """
-    # Format the prefix-suffix prompt
-    constrained_prompt = f"{prompt}\n[Your response must start with: {prefix} and end with: {suffix}]"
-    response = ollama.chat(
-        model=model,
-        messages=[{"role": "user", "content": constrained_prompt}]
-    )
-    return response.message.content
+    # The raw prompt already ends with the prefix, so the model continues from
+    # it, and the server stops generating as soon as the suffix is produced
+    try:
+        content = _generate(model, f"{prompt}\n{prefix}", raw=True, options={"stop": [suffix]})
+        return prefix + content + suffix
+    except ollama.ResponseError:
+        # Models served without raw completion get the constraint in the prompt
+        constrained_prompt = f"{prompt}\n[Your response must start with: {prefix} and end with: {suffix}]"
+        return _chat(model, [{"role": "user", "content": constrained_prompt}])
 
 
 def conversational_prompt(
@@ -111,11 +135,9 @@ def conversational_prompt(
         str: The model's response
     """
     # Format messages for Ollama
+    # The system prompt always leads, so the server can reuse its cached
+    # evaluation of the unchanged head of the conversation between turns
     formatted_messages = [{"role": "system", "content": system_prompt}]
     formatted_messages.extend(messages)
-    
-    response = ollama.chat(
-        model=model,
-        messages=formatted_messages
-    )
-    return response.message.content
+
+    return _chat(model, formatted_messages)
@@ -10,8 +10,7 @@ class Base(DeclarativeBase):
     pass
 
 # Import all models to make them available when importing from models
-from .models import CodeSnippet, Note, Reminder, Task
-from .project import Project
+from .models import CodeSnippet, Note, Project, Reminder, Task
 
 # Re-export everything
 __all__ = ['Base', 'Project', 'CodeSnippet', 'Note', 'Reminder', 'Task']
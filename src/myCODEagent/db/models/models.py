@@ -15,10 +15,34 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
+from utils.utils import TTLCache
+
 from . import Base
 
 logger = getLogger(__name__)
 
+# name -> id for recent name lookups. Only ids are kept, never instances, so a
+# cached entry can't outlive the session that loaded it.
+NAME_LOOKUP_TTL = 30.0
+_name_ids = TTLCache(NAME_LOOKUP_TTL)
+
+
+def _get_by_name(db, model, column, name: str):
+    """First model row whose column equals name, resolved by id when recently seen"""
+    key = (model.__tablename__, name)
+    obj_id = _name_ids.get(key)
+    if obj_id is not None:
+        obj = db.get(model, obj_id)
+        # A rename or delete since the lookup falls through to the query
+        if obj is not None and getattr(obj, column.key) == name:
+            return obj
+        _name_ids.pop(key)
+
+    obj = db.query(model).filter(column == name).first()
+    if obj is not None:
+        _name_ids.set(key, obj.id)
+    return obj
+
 
 class UserRole(enum.Enum):
     ADMIN = "admin"
@@ -113,6 +137,11 @@ class Project(Base):
         """Get project by ID"""
         return db.query(cls).filter(cls.id == project_id).first()
 
+    @classmethod
+    def get_by_name(cls, db, name: str):
+        """Get project by name"""
+        return _get_by_name(db, cls, cls.name, name)
+
     @classmethod
     def get_user_projects(cls, db, user_id: int):
         """Get all projects for a user"""
@@ -179,6 +208,7 @@ class Task(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     due_date = Column(DateTime)
+    run_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     assigned_to = Column(Integer, ForeignKey("users.id"))
     
     # Relationships
@@ -217,6 +247,11 @@ class Task(Base):
         """Get record by ID"""
         return db.query(cls).filter(cls.id == taskid).first()
 
+    @classmethod
+    def get_by_name(cls, db, task_name: str):
+        """Get task by name"""
+        return _get_by_name(db, cls, cls.task_name, task_name)
+
 
 class Note(Base):
     __tablename__ = "notes"
@@ -1,17 +1,44 @@
+import asyncio
 import os
+from functools import lru_cache
+from typing import Dict, List
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Table, UniqueConstraint
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, Table, UniqueConstraint, create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, relationship, declarative_base, sessionmaker
 from sqlalchemy.sql import func
 
 Base = declarative_base()
 
+
+@lru_cache(maxsize=1)
+def _session_factory() -> sessionmaker:
+    """Build the shared engine and session factory on first use"""
+    engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"), pool_size=10, pool_pre_ping=True)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def _session() -> Session:
+    """Open a session on the shared, pooled engine"""
+    return _session_factory()()
+
+
+@lru_cache(maxsize=1)
+def _async_session_factory() -> async_sessionmaker:
+    """Build the shared asyncpg engine and session factory on first use"""
+    url = os.getenv("SUPABASE_DATABASE_URL").replace("postgresql://", "postgresql+asyncpg://", 1)
+    engine = create_async_engine(url, pool_size=10, pool_pre_ping=True)
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
 # Association tables
 project_tasks = Table(
     'project_tasks',
     Base.metadata,
     Column('project_id', Integer, ForeignKey('projects.id'), primary_key=True),
-    Column('task_id', Integer, ForeignKey('tasks.id'), primary_key=True)
+    Column('task_id', Integer, ForeignKey('tasks.id'), primary_key=True),
+    # The primary key covers lookups by project; this covers the reverse
+    Index('ix_project_tasks_task_id', 'task_id'),
 )
 
 
@@ -55,49 +82,32 @@ class Project(Base):
     @classmethod
     def get_by_project_name(cls, name: str):
         """Get a project by name"""
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
-
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).filter(cls.name == name).first()
+        with _session() as session:
+            return session.query(cls).filter(cls.name == name).first()
 
     @classmethod
     def get_all(cls):
         """Get all projects"""
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
-
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).all()
+        with _session() as session:
+            return session.query(cls).all()
 
     @classmethod
-    def get_by_project_id(cls, user_id: int):
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
+    def get_by_owner_id(cls, user_id: int):
+        with _session() as session:
+            return session.query(cls).filter(cls.owner_id == user_id).all()
 
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).filter(cls.owner_id == user_id).all()
+    # Old name, kept for existing callers; it always filtered on owner_id
+    get_by_project_id = get_by_owner_id
 
     @classmethod
     def get_by_status(cls, status: str):
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
-
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).filter(cls.status == status).all()
+        with _session() as session:
+            return session.query(cls).filter(cls.status == status).all()
 
     @classmethod
     def get_by_priority(cls, priority: int):
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
-
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).filter(cls.priority == priority).all()
+        with _session() as session:
+            return session.query(cls).filter(cls.priority == priority).all()
 
 
 class Task(Base):
@@ -131,67 +141,50 @@ class Task(Base):
     @classmethod
     def get_by_name(cls, name: str):
         """Get a task by name"""
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
-
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).filter(cls.title == name).first()
+        with _session() as session:
+            return session.query(cls).filter(cls.title == name).first()
 
     @classmethod
     def get_all(cls):
         """Get all tasks"""
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
-
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).all()
+        with _session() as session:
+            return session.query(cls).all()
 
     @classmethod
     def get_by_task_id(cls, user_id: int):
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
-
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).filter(cls.user_id == user_id).all()
+        with _session() as session:
+            return session.query(cls).filter(cls.user_id == user_id).all()
 
     @classmethod
-    def get_all_tasks_attached_to_project_id(cls, project_id: int, task_id: int):
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
+    def for_project(cls, project_id: int):
+        """Get the tasks attached to a project"""
+        stmt = (
+            select(cls)
+            .join(project_tasks, project_tasks.c.task_id == cls.id)
+            .where(project_tasks.c.project_id == project_id)
+        )
+        with _session() as session:
+            return session.scalars(stmt).all()
 
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).filter(cls.projects.any(id=project_id)).all()
+    @classmethod
+    def get_all_tasks_attached_to_project_id(cls, project_id: int, task_id: int = None):
+        """Old name for for_project, kept for existing callers; task_id is unused"""
+        return cls.for_project(project_id)
 
     @classmethod
     def get_tasks_for_project_by_status(cls, status: str):
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
-
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).filter(cls.status == status).all()
+        with _session() as session:
+            return session.query(cls).filter(cls.status == status).all()
 
     @classmethod
     def get_by_priority(cls, priority: int):
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
-
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).filter(cls.priority == priority).all()
+        with _session() as session:
+            return session.query(cls).filter(cls.priority == priority).all()
 
     @classmethod
     def get_by_due_date(cls, due_date: str):
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
-
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).filter(cls.due_date == due_date).all()
+        with _session() as session:
+            return session.query(cls).filter(cls.due_date == due_date).all()
 
 
 class TaskDependency(Base):
@@ -210,30 +203,18 @@ class TaskDependency(Base):
     @classmethod
     def get_all(cls):
         """Get all task dependencies"""
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
-
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).all()
+        with _session() as session:
+            return session.query(cls).all()
 
     @classmethod
     def get_by_task_id(cls, task_id: int):
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
-
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).filter(cls.task_id == task_id).all()
+        with _session() as session:
+            return session.query(cls).filter(cls.task_id == task_id).all()
 
     @classmethod
     def get_by_dependent_on_id(cls, dependent_on_id: int):
-        from sqlalchemy.orm import Session
-        from sqlalchemy import create_engine
-
-        engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-        session = Session(engine)
-        return session.query(cls).filter(cls.dependent_on_id == dependent_on_id).all()
+        with _session() as session:
+            return session.query(cls).filter(cls.dependent_on_id == dependent_on_id).all()
 
 
 class CalendarEvent(Base):
@@ -301,26 +282,35 @@ class TagAssociation(Base):
 @classmethod
 def get_by_name(cls, name: str):
     """Get a record by name"""
-    from sqlalchemy.orm import Session
-    from sqlalchemy import create_engine
-
-    engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-    session = Session(engine)
-    return session.query(cls).filter(cls.name == name).first()
+    with _session() as session:
+        return session.query(cls).filter(cls.name == name).first()
 
 
 @classmethod
 def get_all(cls):
     """Get all records"""
-    from sqlalchemy.orm import Session
-    from sqlalchemy import create_engine
+    with _session() as session:
+        return session.query(cls).all()
+
 
-    engine = create_engine(os.getenv("SUPABASE_DATABASE_URL"))
-    session = Session(engine)
-    return session.query(cls).all()
+@classmethod
+async def get_all_async(cls):
+    """Get all records without blocking the event loop"""
+    async with _async_session_factory()() as session:
+        return (await session.scalars(select(cls))).all()
+
+
+async def gather_dashboard() -> Dict[str, List]:
+    """Load projects, tasks, dependencies and users concurrently"""
+    projects, tasks, dependencies, users = await asyncio.gather(
+        Project.get_all_async(), Task.get_all_async(), TaskDependency.get_all_async(), User.get_all_async()
+    )
+    return {"projects": projects, "tasks": tasks, "dependencies": dependencies, "users": users}
 
 
 # Add helper methods to relevant classes
 for cls in [Project, Task, User]:
     cls.get_by_name = get_by_name
-    cls.get_all = get_all
\ No newline at end of file
+    cls.get_all = get_all
+for cls in [Project, Task, User, TaskDependency]:
+    cls.get_all_async = get_all_async
\ No newline at end of file
@@ -1,9 +1,12 @@
+import atexit
+import functools
 import logging
 import os
 from typing import Optional
 
 import psycopg2
 from dotenv import load_dotenv
+from psycopg2 import pool
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT, connection
 from supabase import Client, create_client
 
@@ -29,33 +32,47 @@ def get_supabase_client() -> Optional[Client]:
         return None
 
 
+def _connection_params() -> dict:
+    """Connection settings from the environment, preferring Supabase."""
+    supabase_db = os.getenv("SUPABASE_DATABASE", "postgres")
+    supabase_user = os.getenv("SUPABASE_USER")
+    supabase_password = os.getenv("SUPABASE_PASSWORD")
+    supabase_host = os.getenv("SUPABASE_HOST")
+
+    if all([supabase_db, supabase_user, supabase_password, supabase_host]):
+        return {
+            "dbname": supabase_db,
+            "user": supabase_user,
+            "password": supabase_password,
+            "host": supabase_host,
+            "port": os.getenv("POSTGRES_PORT", "5432"),
+        }
+
+    # Fallback to regular PostgreSQL connection
+    return {
+        "dbname": os.getenv("POSTGRES_DB"),
+        "user": os.getenv("POSTGRES_USER"),
+        "password": os.getenv("POSTGRES_PASSWORD"),
+        "host": os.getenv("POSTGRES_HOST"),
+        "port": os.getenv("POSTGRES_PORT", "5432"),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pool() -> pool.ThreadedConnectionPool:
+    """Get the process-wide connection pool, connecting on first use."""
+    db_pool = pool.ThreadedConnectionPool(1, 8, **_connection_params())
+    atexit.register(db_pool.closeall)
+    return db_pool
+
+
 def get_db_connection() -> connection:
-    """Create a connection to PostgreSQL using environment variables."""
-    try:
-        # Try Supabase connection first
-        supabase_db = os.getenv("SUPABASE_DATABASE", "postgres")
-        supabase_user = os.getenv("SUPABASE_USER")
-        supabase_password = os.getenv("SUPABASE_PASSWORD")
-        supabase_host = os.getenv("SUPABASE_HOST")
-
-        if all([supabase_db, supabase_user, supabase_password, supabase_host]):
-            conn = psycopg2.connect(
-                dbname=supabase_db,
-                user=supabase_user,
-                password=supabase_password,
-                host=supabase_host,
-                port=os.getenv("POSTGRES_PORT", "5432"),
-            )
-        else:
-            # Fallback to regular PostgreSQL connection
-            conn = psycopg2.connect(
-                dbname=os.getenv("POSTGRES_DB"),
-                user=os.getenv("POSTGRES_USER"),
-                password=os.getenv("POSTGRES_PASSWORD"),
-                host=os.getenv("POSTGRES_HOST"),
-                port=os.getenv("POSTGRES_PORT", "5432"),
-            )
+    """Borrow a pooled PostgreSQL connection.
 
+    Return it with release_db_connection() rather than closing it.
+    """
+    try:
+        conn = _get_pool().getconn()
         conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
         return conn
     except psycopg2.Error as e:
@@ -63,30 +80,37 @@ def get_db_connection() -> connection:
         raise
 
 
+def release_db_connection(conn: connection) -> None:
+    """Return a connection from get_db_connection() to the pool."""
+    _get_pool().putconn(conn)
+
+
+SUPABASE_ENV_VARS = (
+    "SUPABASE_URL",
+    "SUPABASE_KEY",
+    "SUPABASE_DATABASE",
+    "SUPABASE_USER",
+    "SUPABASE_PASSWORD",
+    "SUPABASE_HOST",
+)
+POSTGRES_ENV_VARS = (
+    "POSTGRES_DB",
+    "POSTGRES_USER",
+    "POSTGRES_PASSWORD",
+    "POSTGRES_HOST",
+)
+
+
 def validate_db_config() -> bool:
     """Validate that all required database environment variables are set."""
+    env = os.environ
+
     # Check Supabase credentials first
-    supabase_vars = [
-        "SUPABASE_URL",
-        "SUPABASE_KEY",
-        "SUPABASE_DATABASE",
-        "SUPABASE_USER",
-        "SUPABASE_PASSWORD",
-        "SUPABASE_HOST",
-    ]
-
-    if all(os.getenv(var) for var in supabase_vars):
+    if all(env.get(var) for var in SUPABASE_ENV_VARS):
         return True
 
     # Fallback to checking PostgreSQL credentials
-    postgres_vars = [
-        "POSTGRES_DB",
-        "POSTGRES_USER",
-        "POSTGRES_PASSWORD",
-        "POSTGRES_HOST",
-    ]
-
-    missing = [var for var in postgres_vars if not os.getenv(var)]
+    missing = [var for var in POSTGRES_ENV_VARS if not env.get(var)]
 
     if missing:
         logger.error(f"Missing required environment variables: {', '.join(missing)}")
@@ -8,20 +8,23 @@ import inquirer
 import yaml
 from colorama import Fore, Style, init
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 init()  # Initialize colorama
 
 
 def load_yaml(file_path: str) -> Dict[str, Any]:
     """Load YAML file"""
     with open(file_path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def save_yaml(file_path: str, data: Dict[str, Any]) -> None:
     """Save data to YAML file"""
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
     with open(file_path, "w") as f:
-        yaml.dump(data, f, sort_keys=False, indent=2)
+        yaml.dump(data, f, Dumper=_YamlDumper, sort_keys=False, indent=2)
 
 
 def get_template_path(template_name: str) -> str:
@@ -1,48 +1,71 @@
+import functools,os,sys
+from types import MappingProxyType
 import yaml
-def load_config(file):
- with open(file,'r') as f:return yaml.safe_load(f)
-def manual_select(domains):
+_Loader=getattr(yaml,"CSafeLoader",yaml.SafeLoader)
+_YES=frozenset(("yes","y","sure","ok"))
+_CONFIRM=frozenset(("yes","y"))
+def _freeze(x):
+ if isinstance(x,dict):return MappingProxyType({k:_freeze(v) for k,v in x.items()})
+ if isinstance(x,list):return tuple(_freeze(v) for v in x)
+ return x
+@functools.lru_cache(maxsize=128)
+def _parse(file,mtime_ns):
+ with open(file,'r') as f:return _freeze(yaml.load(f,Loader=_Loader))
+def load_config(file):return _parse(file,os.stat(file).st_mtime_ns)
+def _ask(prompt,answers=None):
+ if answers is None:return input(prompt)
+ ans=next(answers,None)
+ if ans is None:raise EOFError
+ return ans
+def manual_select(domains,answers=None):
  print("Select a domain:")
  opts=[d for d in domains if d!="generic"]
  for i,d in enumerate(opts):print(f"{i+1}: {d}")
  try:
-  sel=int(input("Enter number: "))
+  sel=int(_ask("Enter number: ",answers))
   return opts[sel-1] if 1<=sel<=len(opts) else None
  except:return None
-def dynamic_select(config):
- scores={d:0 for d in config['domains'] if d!="generic"}
- for q in config['domains']['generic'].get('questions',[]):
-  input(q['prompt']+" ")
- for d,data in config['domains'].items():
+def dynamic_select(config,answers=None):
+ answers=None if answers is None else iter(answers)
+ domains=config['domains']
+ scores={d:0 for d in domains if d!="generic"}
+ for q in domains['generic'].get('questions',[]):
+  _ask(q['prompt']+" ",answers)
+ for d,data in domains.items():
   if d=="generic":continue
+  threshold=data.get('threshold',0)
   for q in data.get('questions',[]):
-   ans=input(q['prompt']+" ").strip().lower()
-   if ans in q.get('positive',["yes","y","sure","ok"]):
+   ans=_ask(q['prompt']+" ",answers).strip().lower()
+   if ans in q.get('positive',_YES):
     for dom,wt in q.get('weights',{}).items():
      if dom in scores:scores[dom]+=wt
-  if scores[d]>=data.get('threshold',0):
+  if scores[d]>=threshold:
    print(f"Domain '{d}' activated (score: {scores[d]})")
    return d,scores
  return "generic",scores
-def generate_spec(domain,scores):
- spec=f"Template Spec for domain: {domain}\nScores: {scores}\nSections:\n- General Overview\n"
+def generate_spec(domain,scores):return _render_spec(domain,tuple(scores.items()))
+@functools.lru_cache(maxsize=32)
+def _render_spec(domain,score_items):
+ spec=f"Template Spec for domain: {domain}\nScores: {dict(score_items)}\nSections:\n- General Overview\n"
  if domain!="generic":spec+=f"- {domain.replace('_',' ').title()} Specific Section\n"
  spec+="Prompts:\n- Include detailed prompts for various areas (e.g., business, legal, tech, art, etc.)\nEngineer: use this spec to build the project.\n"
  return spec
-def final_confirm(spec):
+def final_confirm(spec,answers=None):
  print("Generated Spec:\n"+spec)
- return input("Does this spec meet your intent? (yes/no) ").strip().lower() in ["yes","y"]
+ return _ask("Does this spec meet your intent? (yes/no) ",answers).strip().lower() in _CONFIRM
 def main():
  config=load_config("template_config.yml")
+ domains=config['domains']
+ answers=None if sys.stdin.isatty() else iter(sys.stdin.read().splitlines())
  while True:
-  mode=input("Manual domain selection? (yes/no) ").strip().lower()
-  if mode in ["yes","y"]:
-   domain=manual_select(config['domains'])
+  mode=_ask("Manual domain selection? (yes/no) ",answers).strip().lower()
+  if mode in _CONFIRM:
+   domain=manual_select(domains,answers)
    scores={}
   else:
-   domain,scores=dynamic_select(config)
+   domain,scores=dynamic_select(config,answers)
   spec=generate_spec(domain,scores)
-  if final_confirm(spec):break
+  if final_confirm(spec,answers):break
   print("Restarting template generation...\n")
  print("Final Template Spec:\n"+spec)
 if __name__=="__main__":
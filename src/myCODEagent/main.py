@@ -1,19 +1,22 @@
+import functools
 import logging
 import os
+import shlex
 import signal
 import subprocess
+import sys
 import asyncio
 from enum import Enum
 from pathlib import Path
+from typing import List
 import typer
-from core.voice import VoiceCommandSystem
 from utils.shared_state import SharedState, FocusState
 from core.cli import (
 
     project, handle_create_project, think_speak, tts, status,
     start as cli_start, ping, process_text, get_connection,
     list_projects, create_project, create_task, ping_server,
-    show_config, list_files, list_users, create_user,
+    show_config, list_users, create_user,
     delete_user, generate_report, backup_data, restore_data,
     summarize_logs, upload_file, download_file, filter_records,
     compare_files, encrypt_data, decrypt_data, migrate_database,
@@ -25,9 +28,8 @@ from core.cli import (
 logger = logging.getLogger(__name__)
 app = typer.Typer()
 PID_FILE = Path("/tmp/aiden.pid")
-
-# Focus state management
-ASSISTANT_FOCUSED = False
+# Set in the environment of a daemonized assistant, pointing at its PID file
+DAEMON_PID_FILE_ENV = "AIDEN_DAEMON_PID_FILE"
 
 # Register all commands with the Typer app
 app.command()(initialize)
@@ -44,7 +46,6 @@ app.command()(list_projects)
 app.command()(create_project)
 app.command()(ping_server)
 app.command()(show_config)
-app.command()(list_files)
 app.command()(list_users)
 app.command()(create_user)
 app.command()(delete_user)
@@ -99,7 +100,7 @@ def main():
 
 def set_assistant_focus(focused: bool):
     """Set assistant focus state"""
-    SharedState.set_focus_state(FocusState.FOCUSED if focused else FocusState.UNFOCUSED)
+    SharedState.set_focus_state_sync(FocusState.FOCUSED if focused else FocusState.UNFOCUSED)
     logger.info(f"Assistant focus set to: {focused}")
 
 
@@ -107,67 +108,93 @@ def is_assistant_focused() -> bool:
     return SharedState.is_focused()
 
 
-def set_assistant_focus(focused: bool):
-    """Set assistant focus state"""
-    global ASSISTANT_FOCUSED
-    ASSISTANT_FOCUSED = focused
-    logger.info(f"Assistant focus set to: {focused}")
-
-
-def is_assistant_focused() -> bool:
-    return ASSISTANT_FOCUSED
-
-
 class Mode(str, Enum):
     CLI = "cli"
     VOICE = "voice"
     BOTH = "both"
 
 
+def _install_daemon_cleanup(pid_file: Path):
+    """On SIGTERM, remove the PID file and take the whole process group down"""
+    from utils.utils import stop_log_listeners
+
+    def handle_sigterm(signum, frame):
+        # killpg ends us without running atexit, so write out the queued and
+        # buffered log records ourselves first
+        stop_log_listeners()
+        logging.shutdown()
+        pid_file.unlink(missing_ok=True)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        os.killpg(os.getpgid(0), signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+
 class Daemonize:
-    def __init__(self, app_name: str, pid_file: Path, action, chdir: str):
+    __slots__ = ("app_name", "pid_file", "argv", "chdir", "_cached_pid")
+
+    def __init__(self, app_name: str, pid_file: Path, argv: List[str], chdir: str):
         self.app_name = app_name
         self.pid_file = pid_file
-        self.action = action
+        self.argv = argv
         self.chdir = chdir
+        self._cached_pid = None
+
+    def read_pid(self) -> int:
+        """Return the daemon's PID from the PID file, reading it only once"""
+        if self._cached_pid is None:
+            self._cached_pid = int(self.pid_file.read_text().strip())
+        return self._cached_pid
 
     def start(self):
         """Start the assistant as a background process"""
-        if self.pid_file.exists():
+        # Creating the PID file exclusively both claims it and tells us if
+        # another start got there first, without a separate exists() check
+        try:
+            fd = os.open(self.pid_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
             typer.echo("🚫 Assistant is already running")
             return
 
-        pid = os.fork()
-        if pid > 0:
-            typer.echo(f"✅ Assistant started with PID {pid}")
-            self.pid_file.write_text(str(pid))
-            return
-
-        os.chdir(self.chdir)
-        os.setsid()
-        os.umask(0)
-
-        with open(self.pid_file, "w") as f:
-            f.write(str(os.getpid()))
-
-        self.action()
+        try:
+            # Spawn a fresh interpreter in its own session instead of forking
+            # this one, so the child doesn't inherit our imported modules,
+            # event loop or open descriptors
+            proc = subprocess.Popen(
+                self.argv,
+                cwd=self.chdir,
+                env={**os.environ, DAEMON_PID_FILE_ENV: str(self.pid_file)},
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+                umask=0,
+            )
+            os.write(fd, str(proc.pid).encode())
+        except BaseException:
+            self.pid_file.unlink(missing_ok=True)
+            raise
+        finally:
+            os.close(fd)
+        self._cached_pid = proc.pid
+        typer.echo(f"✅ Assistant started with PID {proc.pid}")
 
     def stop(self):
         """Stop the assistant"""
-        if not self.pid_file.exists():
+        try:
+            pid = self.read_pid()
+        except FileNotFoundError:
             typer.echo("❌ Assistant is not running")
             return
-
-        with open(self.pid_file, "r") as f:
-            pid = int(f.read().strip())
+        self._cached_pid = None
 
         try:
             os.kill(pid, signal.SIGTERM)
-            self.pid_file.unlink()
+            self.pid_file.unlink(missing_ok=True)
             typer.echo("✅ Assistant stopped")
         except ProcessLookupError:
             typer.echo("❌ Process not found, cleaning up PID file")
-            self.pid_file.unlink()
+            self.pid_file.unlink(missing_ok=True)
 
 
 # -----------------------------------------------------
@@ -188,20 +215,6 @@ def unfocus():
     typer.echo("💤 Assistant unfocused")
 
 
-@app.command()
-def focus():
-    """Focus the assistant for commands"""
-    set_assistant_focus(True)
-    typer.echo("🎯 Assistant focused and ready")
-
-
-@app.command()
-def unfocus():
-    """Unfocus the assistant"""
-    set_assistant_focus(False)
-    typer.echo("💤 Assistant unfocused")
-
-
 @app.command()
 def start(
     mode: Mode = typer.Option(Mode.CLI, "--mode", "-m"),
@@ -209,7 +222,8 @@ def start(
 ):
     """Start the assistant in specified mode"""
     if daemon:
-        daemon = Daemonize("aiden", PID_FILE, lambda: run_mode(mode), os.getcwd())
+        argv = [sys.executable, os.path.abspath(__file__), "start", "--mode", mode.value]
+        daemon = Daemonize("aiden", PID_FILE, argv, os.getcwd())
         daemon.start()
     else:
         run_mode(mode)
@@ -217,69 +231,106 @@ def start(
 
 def run_mode(mode: Mode):
     """Execute mode-specific behavior"""
+    # Only the daemonized process handles SIGTERM; in the foreground the
+    # default disposition stays. The variable is dropped once read so tools
+    # and nested runs launched from the daemon don't take it for themselves.
+    daemon_pid_file = os.environ.pop(DAEMON_PID_FILE_ENV, None)
+    if daemon_pid_file:
+        _install_daemon_cleanup(Path(daemon_pid_file))
+    asyncio.run(_run_mode_async(mode))
+
+
+async def _run_mode_async(mode: Mode):
+    """Run the voice system and the CLI side by side on one loop"""
+    tasks = []
     if mode == Mode.VOICE or mode == Mode.BOTH:
+        # Imported here so CLI-only runs never load the audio stack
+        from core.voice import VoiceCommandSystem
+
         voice_system = VoiceCommandSystem(logging.getLogger(__name__))
-        asyncio.run(voice_system.start())
+        tasks.append(asyncio.create_task(voice_system.start()))
     if mode == Mode.CLI or mode == Mode.BOTH:
-        app()  # Start the CLI interface using Typer app
+        # The Typer app blocks, so it gets a worker thread of its own
+        tasks.append(asyncio.get_running_loop().run_in_executor(None, _run_cli))
+    await asyncio.gather(*tasks)
 
 
-@app.command()
-def stop():
-    """Stop the assistant"""
-    daemon = Daemonize("aiden", PID_FILE, None, os.getcwd())
-    daemon.stop()
+@functools.lru_cache(maxsize=1)
+def _cli_command():
+    """Convert the Typer app into its Click command once per process"""
+    return typer.main.get_command(app)
 
 
+def _run_cli():
+    """Read commands from stdin and run each through the CLI until EOF or exit"""
+    import click
 
-
-# Update the execute_tool function
-def execute_tool(command: str):
-    """Run a system command"""
-    if not SharedState.is_focused():
-        typer.echo("Assistant is unfocused. Use 'focus' command first.")
-        return
-    try:
-        output = subprocess.run(command, shell=True, capture_output=True, text=True)
-        typer.echo(f"🛠️ Tool Output:\n{output.stdout}")
-    except Exception as e:
-        typer.echo(f"❌ Error running command: {str(e)}")
-
-    # Update list_files function
+    # Commands come from the prompt, never from sys.argv: that still holds the
+    # `start --mode ...` that got us here and would only start us again
+    command = _cli_command()
+    while True:
+        try:
+            line = input("aiden> ")
+        except EOFError:
+            return 0
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            typer.echo(f"❌ {e}")
+            continue
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            return 0
+        if args[0] == "start":
+            typer.echo("⚠️ Assistant is already running")
+            continue
+        try:
+            command.main(args=args, prog_name="aiden", standalone_mode=False)
+        except click.ClickException as e:
+            e.show()
+        except click.Abort:
+            typer.echo("🚫 Aborted")
 
 
 @app.command()
-def list_files(directory: str = "."):
-    """List files in a directory"""
-    if not SharedState.is_focused():
-        typer.echo("Assistant is unfocused. Use 'focus' command first.")
-        return
+def stop():
+    """Stop the assistant"""
+    daemon = Daemonize("aiden", PID_FILE, [], os.getcwd())
+    daemon.stop()
 
-    try:
-        files = os.listdir(directory)
-        typer.echo(f"📂 Files in '{directory}': {files}")
-    except Exception as e:
-        typer.echo(f"❌ Error accessing directory: {str(e)}")
 
 # -----------------------------------------------------
 # TOOL & FILE ACCESS
 # -----------------------------------------------------
-def execute_tool(command: str):
+async def execute_tool(command: str):
     """Run a system command"""
     if not is_assistant_focused():
         typer.echo("Assistant is unfocused. Use 'focus' command first.")
         return
     try:
-        output = subprocess.run(command, shell=True, capture_output=True, text=True)
-        typer.echo(f"🛠️ Tool Output:\n{output.stdout}")
+        # Exec the program directly rather than through /bin/sh, and wait on
+        # it without blocking the event loop
+        proc = await asyncio.create_subprocess_exec(
+            *shlex.split(command),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, _ = await proc.communicate()
+        typer.echo(f"🛠️ Tool Output:\n{stdout.decode(errors='replace')}")
     except Exception as e:
         typer.echo(f"❌ Error running command: {str(e)}")
 
 
+async def execute_tools(commands: List[str]):
+    """Run several system commands concurrently"""
+    await asyncio.gather(*(execute_tool(command) for command in commands))
+
+
 @app.command()
 def run_tool(tool_name: str):
     """Execute a system tool"""
-    execute_tool(tool_name)
+    asyncio.run(execute_tool(tool_name))
 
 
 @app.command()
@@ -290,7 +341,10 @@ def list_files(directory: str = "."):
         return
 
     try:
-        files = os.listdir(directory)
+        # scandir reads each entry's type along with its name, so directories
+        # are marked without a stat() per entry
+        with os.scandir(directory) as entries:
+            files = [e.name + "/" if e.is_dir(follow_symlinks=False) else e.name for e in entries]
         typer.echo(f"📂 Files in '{directory}': {files}")
     except Exception as e:
         typer.echo(f"❌ Error accessing directory: {str(e)}")
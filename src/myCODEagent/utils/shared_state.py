@@ -1,4 +1,6 @@
-from typing import Callable, List
+import asyncio
+import threading
+from typing import Awaitable, Callable, Set
 from enum import Enum
 
 
@@ -9,8 +11,11 @@ class FocusState(Enum):
 
 class SharedState:
     _instance = None
-    _focus_state: FocusState = FocusState.UNFOCUSED
-    _focus_handlers: List[Callable[[FocusState], None]] = []
+    # Set while focused; reading it is a single atomic check from any thread
+    _focus_event = threading.Event()
+    _focus_handlers: Set[Callable[[FocusState], Awaitable[None]]] = set()
+    # Notifications scheduled from inside a running loop, kept until done
+    _pending: Set[asyncio.Task] = set()
 
     def __new__(cls):
         if cls._instance is None:
@@ -19,26 +24,42 @@ class SharedState:
 
     @classmethod
     def get_focus_state(cls) -> FocusState:
-        return cls._focus_state
+        return FocusState.FOCUSED if cls._focus_event.is_set() else FocusState.UNFOCUSED
 
     @classmethod
-    def set_focus_state(cls, state: FocusState):
-        cls._focus_state = state
-        # Notify all handlers of state change
-        for handler in cls._focus_handlers:
-            handler(state)
+    async def set_focus_state(cls, state: FocusState):
+        if state == FocusState.FOCUSED:
+            cls._focus_event.set()
+        else:
+            cls._focus_event.clear()
+        # Notify all handlers of state change concurrently; one failing or
+        # slow handler doesn't hold up or break the others
+        await asyncio.gather(
+            *(handler(state) for handler in cls._focus_handlers), return_exceptions=True
+        )
 
     @classmethod
-    def add_focus_handler(cls, handler: Callable[[FocusState], None]):
-        cls._focus_handlers.append(handler)
+    def set_focus_state_sync(cls, state: FocusState):
+        """Set the focus state from synchronous code"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(cls.set_focus_state(state))
+            return
+        task = loop.create_task(cls.set_focus_state(state))
+        cls._pending.add(task)
+        task.add_done_callback(cls._pending.discard)
 
     @classmethod
-    def remove_focus_handler(cls, handler: Callable[[FocusState], None]):
-        if handler in cls._focus_handlers:
-            cls._focus_handlers.remove(handler)
+    def add_focus_handler(cls, handler: Callable[[FocusState], Awaitable[None]]):
+        cls._focus_handlers.add(handler)
+
+    @classmethod
+    def remove_focus_handler(cls, handler: Callable[[FocusState], Awaitable[None]]):
+        cls._focus_handlers.discard(handler)
 
     @classmethod
     def is_focused(cls) -> bool:
-        return cls._focus_state == FocusState.FOCUSED
+        return cls._focus_event.is_set()
 
 
@@ -1,117 +1,328 @@
 import datetime
-import json
+import functools
 import os
-import subprocess
-import uuid
-from typing import Dict, List, Union
+import string
+import time
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Union
+
+import orjson
 
 OUTPUT_DIR = "output"
+_SESSION_BASE = OUTPUT_DIR + "/"
+
+
+@functools.lru_cache(maxsize=1024)
+def _ensure_dir(directory: str) -> str:
+    """Create a directory once per process, then trust that it exists"""
+    # The parent is usually there already, so a single mkdir does the job;
+    # makedirs only walks the path when it isn't
+    try:
+        os.mkdir(directory)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        os.makedirs(directory, exist_ok=True)
+    return directory
 
 
 def build_file_path(name: str):
-    session_dir = f"{OUTPUT_DIR}"
-    os.makedirs(session_dir, exist_ok=True)
-    return os.path.join(session_dir, f"{name}")
+    return _ensure_dir(OUTPUT_DIR) + "/" + name
 
 
 def build_file_name_session(name: str, session_id: str):
-    session_dir = f"{OUTPUT_DIR}/{session_id}"
-    os.makedirs(session_dir, exist_ok=True)
-    return os.path.join(session_dir, f"{name}")
+    # Both parts come from us, so plain concatenation is enough; os.path.join
+    # would only re-check separators
+    return _ensure_dir(_SESSION_BASE + session_id) + "/" + name
 
 
-def to_json_file_pretty(name: str, content: Union[Dict, List]):
-    def default_serializer(obj):
-        if hasattr(obj, "model_dump"):
-            return obj.model_dump()
-        raise TypeError(
-            f"Object of type {obj.__class__.__name__} is not JSON serializable"
-        )
+# model_dump lookup per type, so large lists of one model class probe it once
+_SERIALIZER_CACHE: Dict[type, Optional[Callable]] = {}
 
-    with open(f"{name}.json", "w") as outfile:
-        json.dump(content, outfile, indent=2, default=default_serializer)
+
+def _default_serializer(obj):
+    t = type(obj)
+    try:
+        fn = _SERIALIZER_CACHE[t]
+    except KeyError:
+        fn = _SERIALIZER_CACHE[t] = getattr(t, "model_dump", None)
+    if fn is not None:
+        return fn(obj)
+    raise TypeError(
+        f"Object of type {obj.__class__.__name__} is not JSON serializable"
+    )
+
+
+def to_json_file_pretty(name: str, content: Union[Dict, List]):
+    # Serialize to UTF-8 bytes in one go and write them once; orjson's only
+    # indent is two spaces, which is the format these files have always had
+    data = orjson.dumps(
+        content,
+        default=_default_serializer,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    )
+    with open(f"{name}.json", "wb") as outfile:
+        outfile.write(data)
+
+
+def tail_lines(path: str, n: int, block_size: int = 1 << 16) -> List[str]:
+    """Read the last n lines of a file, scanning backwards from the end"""
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos, data = end, b""
+        # Grow the buffer backwards until it holds n full lines (or the file)
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+            block_size *= 2
+    text = data.decode(errors="replace")
+    return text.splitlines(keepends=True)[-n:] if n > 0 else []
+
+
+# Last formatted timestamps as [epoch second, date-time, date]; strftime only
+# runs again once the second changes. Unlocked: a racing caller can at worst
+# see the previous second's strings.
+_last_date_strs = [None, "", ""]
+
+
+def _refresh_date_strs() -> list:
+    now = int(time.time())
+    if now != _last_date_strs[0]:
+        t = datetime.datetime.fromtimestamp(now)
+        _last_date_strs[1] = t.strftime("%Y-%m-%d_%H-%M-%S")
+        _last_date_strs[2] = t.strftime("%Y-%m-%d")
+        _last_date_strs[0] = now
+    return _last_date_strs
 
 
 def current_date_time_str() -> str:
-    return datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    return _refresh_date_strs()[1]
 
 
 def current_date_str() -> str:
-    return datetime.datetime.now().strftime("%Y-%m-%d")
+    return _refresh_date_strs()[2]
 
 
 def dict_item_diff_by_set(
     previous_list: List[Dict], current_list: List[Dict], set_key: str
 ) -> List[str]:
-    previous_set = {item[set_key] for item in previous_list}
-    current_set = {item[set_key] for item in current_list}
-    return list(current_set - previous_set)
+    get = itemgetter(set_key)
+    return list(set(map(get, current_list)).difference(map(get, previous_list)))
+
+
+class TTLCache:
+    """Small dict cache whose entries expire ttl seconds after they were set"""
+
+    __slots__ = ("ttl", "maxsize", "_data")
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict = {}
+
+    def get(self, key, default=None):
+        hit = self._data.get(key)
+        if hit is None:
+            return default
+        if time.monotonic() - hit[0] >= self.ttl:
+            del self._data[key]
+            return default
+        return hit[1]
+
+    def set(self, key, value) -> None:
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            # Insertion order makes the first key the oldest one
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic(), value)
+
+    def pop(self, key, default=None):
+        hit = self._data.pop(key, None)
+        return default if hit is None else hit[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
 
 
 def create_session_logger_id() -> str:
-    return (
-        datetime.datetime.now().strftime("%Y%m%d-%H%M%S") + "-" + uuid.uuid4().hex[:6]
-    )
+    import secrets
+
+    return time.strftime("%Y%m%d-%H%M%S") + "-" + secrets.token_hex(3)
 
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
+# Background listeners that do the actual log I/O, one per configured logger
+_log_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_BUFFER_SIZE = 64 * 1024
 
-def setup_logging(session_id: str = None, debug: bool = False, name: str = "aiden"):
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating log file written through a large buffer, flushed on warnings and above"""
+
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=LOG_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            # Rotation is decided from a running size (in characters) instead
+            # of tell() and stat() calls on every record
+            if self.maxBytes and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += len(msg)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# Console emoji indexed by levelno // 10: NOTSET, DEBUG, INFO, WARNING, ERROR, CRITICAL
+_LEVEL_EMOJI = ("", "🐛", "ℹ️", "⚠️", "❌", "🔥")
+
+
+class EmojiFormatter(logging.Formatter):
+    """Prefix each console message with its level's emoji"""
+
+    def format(self, record):
+        # Records arrive through a QueueHandler, which has already merged args
+        # and exception text into the message
+        emoji = _LEVEL_EMOJI[min(record.levelno // 10, 5)]
+        return f"{emoji} {record.getMessage()}"
+
+
+# Formatters hold no per-logger state, so every setup_logging call shares them
+_CONSOLE_FORMATTER = EmojiFormatter()
+_FILE_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+
+def _listener_log_file(listener: logging.handlers.QueueListener) -> Optional[str]:
+    """Absolute path of the log file a listener writes to, if any"""
+    for handler in listener.handlers:
+        if isinstance(handler, logging.FileHandler):
+            return handler.baseFilename
+    return None
+
+
+@dataclass(slots=True)
+class SessionPaths:
+    """Output locations for one session, worked out once when it starts"""
+
+    session_id: str
+    dir: str = field(init=False)
+    log: str = field(init=False)
+
+    def __post_init__(self):
+        self.dir = _ensure_dir(_SESSION_BASE + self.session_id)
+        self.log = self.dir + "/session.log"
+
+
+@atexit.register
+def stop_log_listeners():
+    """Drain and stop every log listener, writing out what they still hold"""
+    for listener in _log_listeners.values():
+        listener.stop()
+    _log_listeners.clear()
+
+
+def setup_logging(
+    session_id: str = None,
+    debug: bool = False,
+    name: str = "aiden",
+    paths: Optional[SessionPaths] = None,
+):
     """Configure logging with session-specific log file and stdout
 
     Args:
         session_id: Optional session ID for log file naming. If None, generates a new one
         debug: Whether to enable debug logging
         name: Name of the logger to create/get. Defaults to 'aiden'
+        paths: Optional precomputed session paths, shared by loggers of one session
 
     Returns:
         logging.Logger: Configured logger instance
     """
-    # Generate session ID if not provided
-    if session_id is None:
-        session_id = create_session_logger_id()
+    if paths is None:
+        # Generate session ID if not provided
+        if session_id is None:
+            session_id = create_session_logger_id()
+        paths = SessionPaths(session_id)
 
-    log_file = build_file_name_session("session.log", session_id)
+    log_file = paths.log
+    level = logging.DEBUG if debug else logging.INFO
 
     # Create or get the logger
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG if debug else logging.INFO)
 
-    # Clear any existing handlers to avoid duplicates
-    logger.handlers.clear()
+    # Already logging this session: keep the open file and its warm buffer,
+    # and only bring the levels up to date
+    current = _log_listeners.get(name)
+    if current is not None and _listener_log_file(current) == os.path.abspath(log_file):
+        logger.setLevel(level)
+        for handler in current.handlers:
+            if not isinstance(handler, logging.FileHandler):
+                handler.setLevel(level)
+        return logger
 
-    # Create formatter with emoji mapping
-    class EmojiFormatter(logging.Formatter):
-        EMOJI_MAP = {
-            logging.INFO: "ℹ️",
-            logging.WARNING: "⚠️",
-            logging.ERROR: "❌",
-            logging.CRITICAL: "🔥",
-            logging.DEBUG: "🐛",
-        }
-
-        def format(self, record):
-            emoji = self.EMOJI_MAP.get(record.levelno, "")
-            record.emoji = emoji
-            return super().format(record)
+    logger.setLevel(level)
+
+    # Clear any existing handlers (and the listener behind them) to avoid duplicates
+    logger.handlers.clear()
+    previous = _log_listeners.pop(name, None)
+    if previous is not None:
+        previous.stop()
 
     # Create console handler
     console = logging.StreamHandler(sys.stdout)
-    console.setLevel(logging.DEBUG if debug else logging.INFO)
-    formatter = EmojiFormatter("%(emoji)s %(message)s")
-    console.setFormatter(formatter)
-    logger.addHandler(console)
+    console.setLevel(level)
+    console.setFormatter(_CONSOLE_FORMATTER)
 
     # Create file handler
-    file_handler = logging.FileHandler(log_file)
+    file_handler = _BufferedRotatingFileHandler(
+        log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, delay=True
+    )
     file_handler.setLevel(logging.DEBUG)  # Always log everything to file
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    file_handler.setFormatter(_FILE_FORMATTER)
+
+    # Callers only enqueue records; a listener thread formats and writes them
+    # to the console and file, so slow disks never stall the caller
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, console, file_handler, respect_handler_level=True
     )
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    listener.start()
+    _log_listeners[name] = listener
+    logger._listener = listener
 
     if debug:
         logger.debug(f"🔧 Debug logging enabled")
@@ -120,15 +331,114 @@ def setup_logging(session_id: str = None, debug: bool = False, name: str = "aide
     return logger
 
 
-def parse_markdown_backticks(str) -> str:
-    if "```" not in str:
-        return str.strip()
-    # Remove opening backticks and language identifier
-    str = str.split("```", 1)[-1].split("\n", 1)[-1]
-    # Remove closing backticks
-    str = str.rsplit("```", 1)[0]
-    # Remove any leading or trailing whitespace
-    return str.strip()
+class FallbackResponder:
+    """Answer each turn with an async primary, backed by a blocking fallback
+
+    Both start on the same input. primary returns None when it has no answer,
+    and an error in it is logged and treated the same way. The fallback's
+    thread can't be interrupted, so when primary answers it finishes in the
+    background and the next turn waits for it first; turns never overlap.
+    """
+
+    def __init__(self, primary, fallback, logger: logging.Logger):
+        self.primary = primary
+        self.fallback = fallback
+        self.logger = logger
+        self._leftover = None
+
+    async def finish(self) -> None:
+        """Wait for a fallback still running from the previous turn"""
+        leftover, self._leftover = self._leftover, None
+        if leftover is None:
+            return
+        try:
+            await leftover
+        except Exception as e:
+            self.logger.error(f"Error in background assistant turn: {str(e)}")
+
+    async def respond(self, text: str):
+        import asyncio
+
+        await self.finish()
+        # primary runs synchronously up to its first await before the
+        # fallback's thread is started, so it can snapshot shared state
+        base = asyncio.ensure_future(asyncio.to_thread(self.fallback, text))
+        try:
+            answer = await self.primary(text)
+        except Exception as e:
+            self.logger.error(f"Error in primary assistant turn: {str(e)}")
+            answer = None
+        if answer is None:
+            return await base
+        self._leftover = base
+        return answer
+
+
+# Basic command mappings: exact phrase -> (command name, args)
+_COMMAND_MAPPINGS: Dict[str, tuple] = {
+    "show all tasks": ("list-tasks", ("--all",)),
+    "list my tasks": ("list-tasks", ()),
+    "show config": ("show-config", ()),
+    "show full config": ("show-config", ("--verbose",)),
+    "backup everything": ("backup-data", ("./backups", "--full")),
+    "create backup": ("backup-data", ("./backups",)),
+    "list users": ("list-users", ()),
+    "show admins": ("list-users", ("--role", "admin")),
+    "ping server": ("ping-server", ()),
+}
+
+
+def parse_voice_command(text: str) -> tuple:
+    """
+    Parse voice command into command name and arguments.
+    Returns tuple of (command_name, args, kwargs)
+    """
+    # Remove filler words. These are plain substring removals, so "pleased"
+    # loses its "please" too; the voice grammar has always worked this way
+    text = text.lower().replace("please", "").replace("could you", "").strip()
+
+    # Check for exact matches first
+    hit = _COMMAND_MAPPINGS.get(text)
+    if hit is not None:
+        return hit[0], list(hit[1]), {}
+
+    # Handle dynamic commands; when several triggers appear, the first one
+    # checked here wins, wherever it sits in the utterance
+    if "create user" in text:
+        parts = text.split("with role")
+        username = parts[0].replace("create user", "").strip()
+        role = parts[1].strip() if len(parts) > 1 else "guest"
+        return "create-user", [username], {"role": role}
+
+    if "create task" in text:
+        parts = text.split("with priority")
+        task_name = parts[0].replace("create task", "").strip()
+        priority = int(parts[1].strip()) if len(parts) > 1 else 1
+        return "queue-task", [task_name], {"priority": priority}
+
+    if "remove task" in text:
+        task_id = text.split("remove task")[-1].strip()
+        return "remove-task", [task_id], {"force": True}
+
+    return None, [], {}
+
+
+def parse_markdown_backticks(text: str) -> str:
+    # Locate the body by index and slice once, instead of chained splits that
+    # each copy the rest of the string
+    start = text.find("```")
+    if start == -1:
+        return text.strip()
+    # Skip the opening fence's line, language identifier included
+    newline = text.find("\n", start + 3)
+    start = start + 3 if newline == -1 else newline + 1
+    # Up to the last fence after it, or to the end if it is never closed
+    end = text.rfind("```", start)
+    return text[start : end if end != -1 else len(text)].strip()
+
+
+# Set once `gh auth status` has succeeded in this process
+_gh_authenticated = False
 
 
 def setup_github_repo(repo_name: str, private: bool = False) -> tuple[bool, str]:
@@ -142,21 +452,28 @@ def setup_github_repo(repo_name: str, private: bool = False) -> tuple[bool, str]
     Returns:
         tuple[bool, str]: (success, message/error)
     """
+    # Only this function shells out, so other importers don't pay for loading
+    # subprocess and shutil
+    import shutil
+    import subprocess
+
+    global _gh_authenticated
     try:
-        # Check for GitHub CLI
-        try:
-            subprocess.run(["gh", "--version"], check=True, capture_output=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        # Check for GitHub CLI with a PATH lookup rather than running it
+        if shutil.which("gh") is None:
             return (
                 False,
                 "GitHub CLI (gh) not found. Please install it first: https://cli.github.com/",
             )
 
-        # Check if already logged in
-        try:
-            subprocess.run(["gh", "auth", "status"], check=True, capture_output=True)
-        except subprocess.CalledProcessError:
-            return False, "Please login to GitHub CLI first using: gh auth login"
+        # Check if already logged in; once it has succeeded, trust it for the
+        # rest of the process
+        if not _gh_authenticated:
+            try:
+                subprocess.run(["gh", "auth", "status"], check=True, capture_output=True)
+            except subprocess.CalledProcessError:
+                return False, "Please login to GitHub CLI first using: gh auth login"
+            _gh_authenticated = True
 
         # Create repository
         visibility = "--private" if private else "--public"
@@ -194,8 +511,12 @@ def run_mode(mode: str) -> None:
 
 def write_pid(pid_file: str) -> None:
     """Write process ID to file."""
-    with open(pid_file, 'w') as f:
-        f.write(str(os.getpid()))
+    # A few bytes don't need a buffered text stream around them
+    fd = os.open(pid_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, str(os.getpid()).encode("ascii"))
+    finally:
+        os.close(fd)
 
 
 def play(audio_file: str) -> None:
@@ -210,16 +531,38 @@ def seed_database() -> None:
     pass
 
 
+@functools.lru_cache(maxsize=64)
+def _caesar_table(shift: int) -> Dict[int, int]:
+    """Translation table rotating ASCII letters by shift"""
+    shift %= 26
+    lower, upper = string.ascii_lowercase, string.ascii_uppercase
+    return str.maketrans(
+        lower + upper, lower[shift:] + lower[:shift] + upper[shift:] + upper[:shift]
+    )
+
+
+# Above this length the NumPy path's fixed setup cost is paid back
+CAESAR_BULK_THRESHOLD = 4096
+
+
+def _caesar_bulk(text: str, shift: int) -> str:
+    """Rotate ASCII letters with vectorized NumPy byte arithmetic"""
+    import numpy as np
+
+    shift %= 26  # keep the uint8 arithmetic below non-negative
+    # Multi-byte UTF-8 sequences only use bytes >= 0x80, so they never match
+    arr = np.frombuffer(text.encode("utf-8"), dtype=np.uint8).copy()
+    for base in (ord("a"), ord("A")):
+        mask = (arr >= base) & (arr < base + 26)
+        arr[mask] = (arr[mask] - base + shift) % 26 + base
+    return arr.tobytes().decode("utf-8")
+
+
 def caesar_cipher_encrypt(text: str, shift: int = 3) -> str:
-    """Simple Caesar cipher encryption."""
-    result = ""
-    for char in text:
-        if char.isalpha():
-            ascii_offset = ord('A') if char.isupper() else ord('a')
-            result += chr((ord(char) - ascii_offset + shift) % 26 + ascii_offset)
-        else:
-            result += char
-    return result
+    """Simple Caesar cipher encryption over ASCII letters."""
+    if len(text) > CAESAR_BULK_THRESHOLD:
+        return _caesar_bulk(text, shift)
+    return text.translate(_caesar_table(shift))
 
 
 def caesar_cipher_decrypt(text: str, shift: int = 3) -> str:
@@ -5,6 +5,7 @@ import yaml
 from pathlib import Path
 
 T = TypeVar('T')
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 @dataclass
@@ -60,7 +61,7 @@ class TemplateLoader:
             raise FileNotFoundError(f"Template {template_name} not found")
 
         with template_path.open() as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
             return spec_type(**data)
 
     def load_all_templates(self, template_type: str) -> List[BaseSpec]:
@@ -74,7 +75,7 @@ class TemplateLoader:
         for yaml_file in self.template_dir.glob("*.yml"):
             with yaml_file.open() as f:
                 try:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=_YamlLoader)
                     if template_type in data:  # Check if file contains relevant specs
                         specs.extend(spec_class(**item) for item in data[template_type])
                 except (yaml.YAMLError, TypeError):
@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import pytest
+
+from db.models import models
+from db.models.models import Project, Task
+
+
+class FakeSession:
+    """Just enough of a Session for the name lookups"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    def get(self, model, obj_id):
+        return self.rows.get(obj_id)
+
+    def query(self, model):
+        self.queries += 1
+        return self
+
+    def filter(self, clause):
+        self.wanted = clause.right.value
+        return self
+
+    def first(self):
+        for row in self.rows.values():
+            if self.wanted in (getattr(row, "name", None), getattr(row, "task_name", None)):
+                return row
+        return None
+
+
+@pytest.fixture(autouse=True)
+def _clear_name_ids():
+    models._name_ids.clear()
+    yield
+    models._name_ids.clear()
+
+
+def test_get_by_name_caches_ids_not_instances():
+    db = FakeSession({1: SimpleNamespace(id=1, name="aiden")})
+    assert Project.get_by_name(db, "aiden").id == 1
+    assert models._name_ids.get(("projects", "aiden")) == 1
+
+    # The next lookup loads by id from whatever session is passed in
+    other = SimpleNamespace(id=1, name="aiden")
+    db2 = FakeSession({1: other})
+    assert Project.get_by_name(db2, "aiden") is other
+    assert db2.queries == 0
+
+
+def test_get_by_name_requeries_after_rename_or_delete():
+    row = SimpleNamespace(id=1, task_name="write docs")
+    db = FakeSession({1: row})
+    assert Task.get_by_name(db, "write docs") is row
+
+    row.task_name = "write more docs"
+    assert Task.get_by_name(db, "write docs") is None
+    assert db.queries == 2
+    assert models._name_ids.get(("tasks", "write docs")) is None
+
+    db = FakeSession({})
+    models._name_ids.set(("tasks", "gone"), 7)
+    assert Task.get_by_name(db, "gone") is None
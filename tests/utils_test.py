@@ -0,0 +1,177 @@
+import asyncio
+import logging
+import string
+import threading
+
+import pytest
+
+import utils.utils as utils_mod
+
+from utils.utils import (
+    FallbackResponder,
+    _caesar_bulk,
+    _caesar_table,
+    caesar_cipher_decrypt,
+    caesar_cipher_encrypt,
+    dict_item_diff_by_set,
+    parse_markdown_backticks,
+    parse_voice_command,
+    TTLCache,
+    tail_lines,
+)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("  plain text  ", "plain text"),
+        ("```python\nprint(1)\n```", "print(1)"),
+        ("```\nbody\n```", "body"),
+        ("Here you go:\n```js\nx = 1;\n```\nThanks", "x = 1;"),
+        # Everything up to the last fence, inner fences included
+        ("```md\na\n```\nb\n```", "a\n```\nb"),
+        # Unclosed fence keeps the rest after its line
+        ("```py\nunclosed", "unclosed"),
+        # A fence line with no newline has no body
+        ("```py", "py"),
+        ("```apy````x\n", ""),
+        ("", ""),
+    ],
+)
+def test_parse_markdown_backticks(text, expected):
+    assert parse_markdown_backticks(text) == expected
+
+
+def test_tail_lines(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(100)))
+
+    assert tail_lines(str(path), 3) == ["line 97\n", "line 98\n", "line 99\n"]
+    # A tiny block forces several backward reads
+    assert tail_lines(str(path), 5, block_size=4) == [f"line {i}\n" for i in range(95, 100)]
+    assert len(tail_lines(str(path), 500)) == 100
+    assert tail_lines(str(path), 0) == []
+
+
+def test_tail_lines_without_trailing_newline(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"a\nb\nc")
+
+    assert tail_lines(str(path), 2) == ["b\n", "c"]
+
+
+def test_tail_lines_empty_file(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"")
+
+    assert tail_lines(str(path), 3) == []
+
+
+def test_caesar_round_trip():
+    text = "Hello, World! zZ aA"
+
+    assert caesar_cipher_encrypt(text, 3) == "Khoor, Zruog! cC dD"
+    assert caesar_cipher_decrypt(caesar_cipher_encrypt(text, 7), 7) == text
+
+
+def test_caesar_table_wraps_and_skips_non_letters():
+    assert "xyz XYZ 123 é".translate(_caesar_table(29)) == "abc ABC 123 é"
+    assert "abc".translate(_caesar_table(-1)) == "zab"
+
+
+@pytest.mark.parametrize("shift", [0, 1, 3, 13, 25, 26, 29, -3, -30])
+def test_caesar_bulk_matches_table(shift):
+    pytest.importorskip("numpy")
+    text = string.printable + "héllo wörld ✓ " + string.ascii_letters * 3
+
+    assert _caesar_bulk(text, shift) == text.translate(_caesar_table(shift))
+
+
+def test_dict_item_diff_by_set():
+    previous = [{"id": "a"}, {"id": "b"}]
+    current = [{"id": "b"}, {"id": "c"}, {"id": "c"}, {"id": "d"}]
+
+    assert sorted(dict_item_diff_by_set(previous, current, "id")) == ["c", "d"]
+    assert dict_item_diff_by_set(current, previous, "id") == ["a"]
+    assert dict_item_diff_by_set([], [], "id") == []
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(utils_mod.time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+    now[0] = 109.9
+    assert cache.get("a") == 1
+    now[0] = 110.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_oldest_when_full():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 3)  # re-setting moves "a" to the back
+    cache.set("c", 4)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (3, 4)
+    assert cache.pop("a") == 3
+    assert cache.pop("a", "gone") == "gone"
+
+
+def test_fallback_responder_uses_fallback_when_primary_raises():
+    async def primary(text):
+        raise RuntimeError("agent down")
+
+    responder = FallbackResponder(primary, lambda text: "base:" + text, logging.getLogger("t"))
+    assert asyncio.run(responder.respond("hi")) == "base:hi"
+    # Nothing is left running for the next turn
+    assert responder._leftover is None
+
+
+def test_fallback_responder_next_turn_waits_for_leftover_fallback():
+    release = threading.Event()
+    finished = []
+
+    def fallback(text):
+        release.wait(5)
+        finished.append(text)
+        return "base:" + text
+
+    async def primary(text):
+        return None if text == "second" else "agent:" + text
+
+    async def turns():
+        responder = FallbackResponder(primary, fallback, logging.getLogger("t"))
+        assert await responder.respond("first") == "agent:first"
+        assert finished == []
+        release.set()
+        # The second turn only starts its fallback once the first one is done
+        assert await responder.respond("second") == "base:second"
+        assert finished == ["first", "second"]
+
+    asyncio.run(turns())
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Please show config", ("show-config", [], {})),
+        ("could you list users please", ("list-users", [], {})),
+        ("create user alice with role admin", ("create-user", ["alice"], {"role": "admin"})),
+        ("create task write docs with priority 3", ("queue-task", ["write docs"], {"priority": 3})),
+        ("remove task 42", ("remove-task", ["42"], {"force": True})),
+        # "kindly" is not a filler word, so this is not an exact match
+        ("kindly show config", (None, [], {})),
+        # Filler is removed as a plain substring, even inside a word
+        ("pleased ping server", (None, [], {})),
+    ],
+)
+def test_parse_voice_command(text, expected):
+    assert parse_voice_command(text) == expected
+
+
+def test_parse_voice_command_trigger_order_beats_position():
+    # "remove task" comes first in the utterance, but "create task" is checked first
+    assert parse_voice_command("remove task 7 then create task lunch")[0] == "queue-task"